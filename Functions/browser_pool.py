@@ -0,0 +1,115 @@
+import asyncio
+import logging
+
+
+class BrowserPool:
+    """Lazily started Playwright browser shared across article extractions.
+
+    Chromium cold-launch costs far more than a typical extraction, so the
+    pool keeps one browser per launch-arg set and one context per site.
+    Contexts are versioned (callers pass the cookie-file mtime) so a
+    refreshed cookie file transparently rebuilds the context.
+    """
+
+    def __init__(self):
+        self._playwright = None
+        self._browsers = {}   # launch args tuple -> Browser
+        self._contexts = {}   # site key -> (version, BrowserContext)
+        self._lock = asyncio.Lock()
+
+    async def get_context(self, site, version=None, launch_args=(), cookies=None,
+                          init_script=None, route=None, **context_kwargs):
+        """Return a cached BrowserContext for site, creating it on first use.
+
+        Cookies, the init script and the optional (pattern, handler) route
+        are applied once, when the context is created; a changed version
+        closes and rebuilds the cached context.
+        """
+        async with self._lock:
+            cached = self._contexts.get(site)
+            if cached is not None:
+                cached_version, context = cached
+                # A context is only good while its browser is: after a
+                # Chromium crash the cached entry would otherwise wedge the
+                # site until the cookie file's mtime changes
+                browser = context.browser
+                if cached_version == version and browser is not None and browser.is_connected():
+                    return context
+                # Cookie file changed or the browser died - rebuild
+                try:
+                    await context.close()
+                except Exception:
+                    pass
+                del self._contexts[site]
+
+            if self._playwright is None:
+                # Deferred so importing an extractor module just for its
+                # cleaning helpers doesn't pay Playwright's import cost
+                from playwright.async_api import async_playwright
+                self._playwright = await async_playwright().start()
+
+            browser_key = tuple(launch_args)
+            browser = self._browsers.get(browser_key)
+            if browser is None or not browser.is_connected():
+                browser = await self._playwright.chromium.launch(
+                    headless=True,
+                    args=list(launch_args)
+                )
+                self._browsers[browser_key] = browser
+
+            context = await browser.new_context(**context_kwargs)
+            if init_script:
+                await context.add_init_script(init_script)
+            if route is not None:
+                await context.route(route[0], route[1])
+            if cookies:
+                try:
+                    # One batched call for the whole jar
+                    await context.add_cookies(cookies)
+                except Exception:
+                    # A malformed cookie poisons the batch - retry one by one
+                    for cookie in cookies:
+                        try:
+                            await context.add_cookies([cookie])
+                        except Exception as e:
+                            logging.warning(f"Failed to add cookie {cookie.get('name')}: {e}")
+
+            self._contexts[site] = (version, context)
+            return context
+
+    async def drop_context(self, site):
+        """Close and forget one cached context (e.g. after a fatal page error)"""
+        async with self._lock:
+            cached = self._contexts.pop(site, None)
+        if cached is not None:
+            try:
+                await cached[1].close()
+            except Exception:
+                pass
+
+    async def shutdown(self):
+        """Close every cached context and browser and stop Playwright"""
+        async with self._lock:
+            contexts = [c for _, c in self._contexts.values()]
+            browsers = list(self._browsers.values())
+            playwright = self._playwright
+            self._contexts = {}
+            self._browsers = {}
+            self._playwright = None
+
+        for context in contexts:
+            try:
+                await context.close()
+            except Exception:
+                pass
+        for browser in browsers:
+            try:
+                await browser.close()
+            except Exception:
+                pass
+        if playwright is not None:
+            await playwright.stop()
+
+
+# Module-level singleton shared by the news extractors
+browser_pool = BrowserPool()
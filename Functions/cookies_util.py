@@ -0,0 +1,63 @@
+import csv
+import logging
+
+# Netscape-format marker for HttpOnly cookies (see http.cookiejar)
+_HTTPONLY_PREFIX = '#HttpOnly_'
+
+
+def _build_cookie(parts):
+    """Build a Playwright cookie dict from the tab-separated Netscape fields"""
+    cookie = {
+        'name': parts[5],
+        'value': parts[6],
+        'domain': parts[0],
+        'path': parts[2],
+        'secure': parts[3] == 'TRUE'
+    }
+
+    # Add expires if not session cookie (one guarded int() call instead of
+    # an isdigit() pre-scan plus conversion)
+    try:
+        expires = int(parts[4])
+    except ValueError:
+        expires = 0
+    if expires > 0:
+        cookie['expires'] = expires
+
+    return cookie
+
+
+def parse_netscape_cookies(file_path, domain_filter=None):
+    """Parse a Netscape cookie file into Playwright cookie dicts.
+
+    #HttpOnly_-prefixed lines are loaded with the prefix stripped, matching
+    the MozillaCookieJar behavior the per-site loaders migrated away from.
+
+    With domain_filter set, lines are matched on domain suffix in both
+    directions (so host cookies apply to the www form and vice versa) and
+    rejected before their dicts are ever built.
+    """
+    try:
+        with open(file_path, 'r', newline='') as f:
+            # csv does the tab splitting in C; QUOTE_NONE keeps fields verbatim
+            rows = list(csv.reader(f, delimiter='\t', quoting=csv.QUOTE_NONE))
+    except FileNotFoundError:
+        logging.error(f"Cookie file {file_path} not found!")
+        return []
+
+    for parts in rows:
+        # Browser exports flag HttpOnly cookies with this prefix; it marks
+        # an attribute, not a comment, and http.cookiejar strips it the same
+        # way. These are usually the auth/session cookies, so keep them.
+        if parts and parts[0].startswith(_HTTPONLY_PREFIX):
+            parts[0] = parts[0][len(_HTTPONLY_PREFIX):]
+
+    return [
+        _build_cookie(parts)
+        for parts in rows
+        if parts and not parts[0].startswith('#') and len(parts) >= 7
+        for cookie_domain in (parts[0].lstrip('.'),)
+        if (domain_filter is None
+            or cookie_domain.endswith(domain_filter)
+            or domain_filter.endswith(cookie_domain))
+    ]
@@ -12,15 +12,8 @@ import uuid  # For generating unique filenames
 from bs4 import BeautifulSoup  # Added BeautifulSoup for HTML parsing
 import subprocess
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,  # Set to INFO to capture important events only
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("./logs/instagram_reel_downloader.log"),  # Log to file
-        logging.StreamHandler()  # Also output to console
-    ]
-)
+# Queue-based handlers keep log writes off the download path
+import Functions.logging_setup  # noqa: F401
 
 # Cookie directory path
 COOKIE_DIR = "./cookies/instagram_cookies/"
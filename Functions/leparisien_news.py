@@ -3,112 +3,372 @@ import logging
 import re
 import os
 import random
-from playwright.async_api import async_playwright
 from urllib.parse import urljoin, urlparse
 
-def parse_netscape_cookies(file_path):
-    """Parse Netscape cookie file format - your exact approach with proper Playwright format"""
-    cookies = []
-    try:
-        with open(file_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line.startswith('#') or not line:
-                    continue
-                
-                parts = line.split('\t')
-                if len(parts) >= 7:
-                    domain = parts[0]
-                    domain_flag = parts[1] == 'TRUE'
-                    path = parts[2]
-                    secure = parts[3] == 'TRUE'
-                    expires = parts[4]
-                    name = parts[5]
-                    value = parts[6]
-                    
-                    # Convert expires timestamp
-                    expires_timestamp = None
-                    if expires != '-1' and expires.isdigit():
-                        expires_timestamp = int(expires)
-                    
-                    cookie = {
-                        'name': name,
-                        'value': value,
-                        'domain': domain,
-                        'path': path,
-                        'secure': secure
-                    }
-                    
-                    # Add expires if not session cookie
-                    if expires_timestamp:
-                        cookie['expires'] = expires_timestamp
-                    
-                    cookies.append(cookie)
-    except FileNotFoundError:
-        logging.error(f"Cookie file {file_path} not found!")
-        return []
-    
-    return cookies
+from Functions.browser_pool import browser_pool
+from Functions.cookies_util import parse_netscape_cookies
+
+# Optional in-process DOM parsing: one page.content() round-trip plus a C
+# HTML parser replaces dozens of Playwright locator round-trips
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:
+    HTMLParser = None
+
+# Precompiled helpers shared by the cleaners below
+_WS_RE = re.compile(r'\s+')
+
+# Le Parisien specific unwanted patterns (your exact list), compiled once at
+# import instead of re-parsed on every clean call
+_LEPARISIEN_PATTERNS = (
+    r'À lire aussi',
+    r'Newsletter.{0,400}?du matin',
+    r'S\'inscrire à la newsletter',
+    r'Toutes les newsletters',
+    r'Un tour de l\'actualité.{0,400}?journée',
+    r'data-ad-articletheme=".*?"',
+    r'data-google-query-id=".*?"',
+    r'class=".*?"',
+    r'id=".*?"',
+    r'style=".*?"',
+    r'target="_blank"',
+    r'rel="noreferrer"',
+    r'aria-label="Advertisement"',
+    r'3rd party ad content',
+    r'google_ads_iframe.*?',
+    r'arcad.{0,400}?adm-ad-rendered',
+    r'pubstack-article-inread-ads',
+    r'lp-pubstack.*?',
+    r'margin_bottom_.*?',
+    r'text_align_.*?',
+    r'lp-f-body-.*?',
+    r'Advertisement',
+    r'Abonnez-vous',
+    r'S\'abonner'
+)
+
+# All removal patterns fused into one alternation so cleaning is a single
+# scan of the text instead of one full pass per pattern
+_LEPARISIEN_COMBINED = re.compile('|'.join(f'(?:{p})' for p in _LEPARISIEN_PATTERNS), re.IGNORECASE | re.DOTALL)
+
+# Cheap probe with one literal cue per removal pattern: most body paragraphs
+# contain none of them, so the heavy combined pass can be skipped entirely
+_LEPARISIEN_AD_PROBE = re.compile(
+    r"(?i)à lire aussi|newsletter|s'inscrire|s'abonner|abonnez-vous|un tour de"
+    r"|data-|class=\"|id=\"|style=\"|target=\"|rel=\"|aria-label|3rd party"
+    r"|google_ads|arcad|pubstack|lp-|margin_bottom_|text_align_|advertisement"
+)
 
 def clean_leparisien_text(text):
     """Clean Le Parisien article text - your exact approach"""
     if not text:
         return None
-    
+
     # Normalize whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
-    
-    # Remove Le Parisien specific unwanted patterns (your exact list)
-    patterns_to_remove = [
-        r'À lire aussi',
-        r'Newsletter.*?du matin',
-        r'S\'inscrire à la newsletter',
-        r'Toutes les newsletters',
-        r'Un tour de l\'actualité.*?journée',
-        r'data-ad-articletheme=".*?"',
-        r'data-google-query-id=".*?"',
-        r'class=".*?"',
-        r'id=".*?"',
-        r'style=".*?"',
-        r'target="_blank"',
-        r'rel="noreferrer"',
-        r'aria-label="Advertisement"',
-        r'3rd party ad content',
-        r'google_ads_iframe.*?',
-        r'arcad.*?adm-ad-rendered',
-        r'pubstack-article-inread-ads',
-        r'lp-pubstack.*?',
-        r'margin_bottom_.*?',
-        r'text_align_.*?',
-        r'lp-f-body-.*?',
-        r'Advertisement',
-        r'Abonnez-vous',
-        r'S\'abonner'
-    ]
-    
-    for pattern in patterns_to_remove:
-        text = re.sub(pattern, '', text, flags=re.IGNORECASE | re.DOTALL)
-    
-    # Clean up extra whitespace and common artifacts
-    text = re.sub(r'\s+', ' ', text).strip()
-    text = re.sub(r'&nbsp;', ' ', text)
-    text = re.sub(r'<!-- -->', '', text)
-    
+    text = _WS_RE.sub(' ', text).strip()
+
+    # Remove Le Parisien specific unwanted patterns (your exact list), but
+    # only when the probe says there is actually something to remove
+    if _LEPARISIEN_AD_PROBE.search(text):
+        text = _LEPARISIEN_COMBINED.sub('', text)
+        text = _WS_RE.sub(' ', text).strip()
+
+    # Clean up common artifacts; these are fixed literal tokens, so plain
+    # str.replace beats the regex engine
+    text = text.replace('&nbsp;', ' ').replace('<!-- -->', '')
+
     return text if len(text) > 50 else None
 
+# Parsed cookie lists keyed by (path, mtime_ns, domain) — the same file is
+# reloaded for every article, and mtime invalidates the entry on refresh
+_COOKIE_CACHE = {}
+
 def load_leparisien_cookies(cookie_file, domain, news_cookies_dir):
     """Load Le Parisien cookies from file - your exact approach"""
     cookie_path = os.path.join(news_cookies_dir, cookie_file)
-    cookies = parse_netscape_cookies(cookie_path)
-    
-    # Filter cookies for Le Parisien domain
-    domain_cookies = []
-    for cookie in cookies:
-        if domain in cookie.get('domain', '') or cookie.get('domain', '').endswith('.leparisien.fr'):
-            domain_cookies.append(cookie)
-    
+    try:
+        mtime = os.stat(cookie_path).st_mtime_ns
+    except OSError:
+        mtime = 0
+
+    key = (cookie_path, mtime, domain)
+    cached = _COOKIE_CACHE.get(key)
+    if cached is not None:
+        return list(cached)
+
+    # Filter for the Le Parisien domain during the parse itself
+    domain_cookies = parse_netscape_cookies(cookie_path, domain_filter=domain)
+
     logging.info(f"Le Parisien: Loaded {len(domain_cookies)} cookies for {domain}")
-    return domain_cookies
+    _COOKIE_CACHE[key] = domain_cookies
+    return list(domain_cookies)
+
+# Stealth bits shared by every pooled context: defined once at import, and
+# registered once per context rather than per page
+_STEALTH_INIT_JS = """
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => undefined,
+    });
+
+    Object.defineProperty(navigator, 'plugins', {
+        get: () => [1, 2, 3, 4, 5],
+    });
+
+    Object.defineProperty(navigator, 'languages', {
+        get: () => ['fr-FR', 'fr', 'en'],
+    });
+
+    window.chrome = {
+        runtime: {},
+    };
+"""
+
+# Your realistic user agents for French market
+_USER_AGENTS = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/121.0',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Safari/605.1.15'
+)
+
+_LAUNCH_ARGS = (
+    '--disable-blink-features=AutomationControlled',
+    '--disable-dev-shm-usage',
+    '--disable-extensions',
+    '--disable-gpu',
+    '--disable-default-apps',
+    '--disable-translate',
+    '--disable-device-discovery-notifications',
+    '--disable-software-rasterizer',
+    '--disable-background-timer-throttling',
+    '--disable-backgrounding-occluded-windows',
+    '--disable-renderer-backgrounding',
+    '--disable-field-trial-config',
+    '--disable-back-forward-cache',
+    '--disable-ipc-flooding-protection',
+    '--no-first-run',
+    '--no-service-autorun',
+    '--password-store=basic',
+    '--use-mock-keychain'
+)
+
+# Selector lists shared by the locator path and the in-process HTML path
+_TITLE_SELECTORS = (
+    "h1.title_xl",
+    "h1",
+    ".title_xl",
+    ".headline",
+    "[data-testid='headline']"
+)
+
+_IMAGE_SELECTORS = (
+    ".pos_rel img.image",
+    "img.image",
+    "img[src*='leparisien.fr']",
+    "img[src*='cloudfront-eu-central-1.images.arcpublishing.com']",
+    ".article-image img",
+    "figure img"
+)
+
+_CONTENT_SELECTORS = (
+    ".article-section",
+    ".article-content",
+    "[data-testid='article-body']",
+    "main article"
+)
+
+# Comma unions let one query_selector round-trip probe every candidate
+# selector instead of one round-trip per selector
+_TITLE_SELECTOR_UNION = ', '.join(_TITLE_SELECTORS)
+_IMAGE_SELECTOR_UNION = ', '.join(_IMAGE_SELECTORS)
+_CONTENT_SELECTOR_UNION = ', '.join(_CONTENT_SELECTORS)
+
+# Python-side mirror of the in-browser skip filter, used by the HTML path
+_LEPARISIEN_SKIP_RE = re.compile(
+    r"newsletter|s'inscrire|toutes les newsletters|à lire aussi|advertisement"
+    r"|google_ads|pubstack|arcad|adm-ad|abonnez-vous|un tour de l'actualité"
+    r"|pour commencer la journée",
+    re.IGNORECASE
+)
+
+def _extract_leparisien_from_html(html_str):
+    """Extract (title, image, article) from raw page HTML with selectolax.
+
+    Returns None when selectolax is unavailable or the parse comes up
+    empty, in which case the caller falls back to Playwright locators.
+    """
+    if HTMLParser is None or not html_str:
+        return None
+
+    tree = HTMLParser(html_str)
+
+    title = None
+    for selector in _TITLE_SELECTORS:
+        node = tree.css_first(selector)
+        if node:
+            candidate = node.text()
+            if candidate:
+                candidate = _WS_RE.sub(' ', candidate.strip()).replace('&nbsp;', ' ')
+                title = clean_leparisien_text(candidate)
+                break
+
+    image_url = None
+    for selector in _IMAGE_SELECTORS:
+        node = tree.css_first(selector)
+        if node:
+            src = node.attributes.get('src')
+            if src:
+                # Handle relative URLs
+                if src.startswith('//'):
+                    src = f"https:{src}"
+                elif src.startswith('/'):
+                    src = f"https://www.leparisien.fr{src}"
+                image_url = src
+                break
+
+    container = tree.css_first(_CONTENT_SELECTOR_UNION)
+    if container is None:
+        return None
+
+    text_parts = []
+    for node in container.css('section.content p, section.content h2, section.content h3'):
+        element_text = node.text().strip()
+        if len(element_text) > 20 and not _LEPARISIEN_SKIP_RE.search(element_text):
+            clean_text = clean_leparisien_text(element_text)
+            if clean_text and len(clean_text) > 30:
+                text_parts.append(clean_text)
+
+    if not text_parts:
+        # Fallback: extract all paragraphs with specific classes
+        for node in container.css('p.paragraph, p.lp-f-body-02'):
+            p_text = node.text().strip()
+            if len(p_text) > 30:
+                clean_text = clean_leparisien_text(p_text)
+                if clean_text and len(clean_text) > 30:
+                    text_parts.append(clean_text)
+
+    if not text_parts:
+        return None
+
+    article_text = ' '.join(text_parts)
+    logging.info(f"✓ Parsed article in-process ({len(text_parts)} elements, {len(article_text)} chars)")
+    return title, image_url, article_text
+
+async def _extract_leparisien_title(page):
+    """Extract and clean the article title (your exact method)"""
+    try:
+        title_element = await page.query_selector(_TITLE_SELECTOR_UNION)
+        if title_element:
+            title = await title_element.text_content()
+            if title:
+                title = title.strip()
+                # Clean up title
+                title = _WS_RE.sub(' ', title)
+                title = title.replace('&nbsp;', ' ')
+                title = clean_leparisien_text(title)
+                logging.info(f"✓ Title: {title}")
+                return title
+    except:
+        pass
+
+    return None
+
+async def _extract_leparisien_image(page):
+    """Extract the first article image URL (your exact method)"""
+    try:
+        img_element = await page.query_selector(_IMAGE_SELECTOR_UNION)
+        if img_element:
+            image_url = await img_element.get_attribute('src')
+            if image_url:
+                # Handle relative URLs
+                if image_url.startswith('//'):
+                    image_url = f"https:{image_url}"
+                elif image_url.startswith('/'):
+                    image_url = f"https://www.leparisien.fr{image_url}"
+                logging.info(f"✓ Image: {image_url}")
+                return image_url
+    except:
+        pass
+
+    return None
+
+# In-browser collection of candidate texts: one evaluate round-trip returns
+# every pre-filtered string instead of one text_content call per element
+_LEPARISIEN_TEXT_JS = """el => {
+    // Compiled multi-pattern matcher: one scan per text instead of a
+    // lowercase copy plus one includes() scan per skip word
+    const skipRe = /newsletter|s'inscrire|toutes les newsletters|\\u00e0 lire aussi|advertisement|google_ads|pubstack|arcad|adm-ad|abonnez-vous|un tour de l'actualit\\u00e9|pour commencer la journ\\u00e9e/i;
+    const out = [];
+    el.querySelectorAll('section.content p, section.content h2, section.content h3').forEach(n => {
+        const t = (n.textContent || '').trim();
+        if (t.length > 20 && !skipRe.test(t)) out.push(t);
+    });
+    return out;
+}"""
+
+_LEPARISIEN_FALLBACK_TEXT_JS = """el => {
+    const out = [];
+    el.querySelectorAll('p.paragraph, p.lp-f-body-02').forEach(n => {
+        const t = (n.textContent || '').trim();
+        if (t.length > 30) out.push(t);
+    });
+    return out;
+}"""
+
+async def _extract_leparisien_article_text(page):
+    """Extract and clean the article body (your exact method)"""
+    try:
+        article_container = await page.query_selector(_CONTENT_SELECTOR_UNION)
+        if article_container:
+            logging.info("✓ Found article container")
+
+        if not article_container:
+            logging.error("❌ Could not find article container")
+            return None
+
+        # Get all paragraphs and headings within content sections, pre-filtered
+        # in the browser so the whole batch comes back in one round-trip
+        raw_texts = await article_container.evaluate(_LEPARISIEN_TEXT_JS)
+
+        if raw_texts:
+            text_parts = []
+            for element_text in raw_texts:
+                clean_text = clean_leparisien_text(element_text)
+                if clean_text and len(clean_text) > 30:
+                    text_parts.append(clean_text)
+
+            if text_parts:
+                article_text = ' '.join(text_parts)
+                logging.info(f"✓ Extracted {len(text_parts)} text elements ({len(article_text)} chars)")
+                return article_text
+
+            logging.error("❌ No valid text elements found")
+            return None
+
+        logging.error("❌ No text elements found - trying fallback")
+
+        # Fallback: extract all paragraphs with specific classes
+        fallback_texts = await article_container.evaluate(_LEPARISIEN_FALLBACK_TEXT_JS)
+        if fallback_texts:
+            text_parts = []
+            for p_text in fallback_texts:
+                clean_text = clean_leparisien_text(p_text)
+                if clean_text and len(clean_text) > 30:
+                    text_parts.append(clean_text)
+
+            if text_parts:
+                article_text = ' '.join(text_parts)
+                logging.info(f"✓ Fallback extracted {len(text_parts)} paragraphs ({len(article_text)} chars)")
+                return article_text
+
+            logging.error("❌ Fallback found no valid content")
+        else:
+            logging.error("❌ No paragraphs found in fallback")
+
+    except Exception as e:
+        logging.error(f"❌ Article extraction error: {e}")
+
+    return None
 
 async def extract_leparisien_article_with_playwright(url, news_cookies_dir, cookie_file='www.leparisien.fr_cookies.txt'):
     """Extract Le Parisien article using Playwright with your exact stealth approach"""
@@ -119,263 +379,93 @@ async def extract_leparisien_article_with_playwright(url, news_cookies_dir, cook
         logging.info(f"Added protocol to URL: {url}")
     
     try:
-        async with async_playwright() as p:
-            # Launch browser with your exact stealth settings
-            browser = await p.chromium.launch(
-                headless=True,  # Production mode
-                args=[
-                    '--disable-blink-features=AutomationControlled',
-                    '--disable-dev-shm-usage',
-                    '--disable-extensions',
-                    '--disable-gpu',
-                    '--disable-default-apps',
-                    '--disable-translate',
-                    '--disable-device-discovery-notifications',
-                    '--disable-software-rasterizer',
-                    '--disable-background-timer-throttling',
-                    '--disable-backgrounding-occluded-windows',
-                    '--disable-renderer-backgrounding',
-                    '--disable-field-trial-config',
-                    '--disable-back-forward-cache',
-                    '--disable-ipc-flooding-protection',
-                    '--no-first-run',
-                    '--no-service-autorun',
-                    '--password-store=basic',
-                    '--use-mock-keychain'
-                ]
-            )
-            
-            # Your realistic user agents for French market
-            user_agents = [
-                'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/121.0',
-                'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Safari/605.1.15'
-            ]
-            
-            selected_ua = random.choice(user_agents)
-            logging.info(f"🎭 Using User Agent: {selected_ua[:50]}...")
-            
-            # Create context with your realistic settings for French market (including Paris geolocation)
-            context = await browser.new_context(
-                user_agent=selected_ua,
-                viewport={'width': 1920, 'height': 1080},
-                device_scale_factor=1,
-                is_mobile=False,
-                has_touch=False,
-                locale='fr-FR',
-                timezone_id='Europe/Paris',
-                permissions=['geolocation'],
-                extra_http_headers={
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
-                    'Accept-Language': 'fr-FR,fr;q=0.9,en;q=0.8',
-                    'Accept-Encoding': 'gzip, deflate, br',
-                    'DNT': '1',
-                    'Connection': 'keep-alive',
-                    'Upgrade-Insecure-Requests': '1',
-                    'Sec-Fetch-Dest': 'document',
-                    'Sec-Fetch-Mode': 'navigate',
-                    'Sec-Fetch-Site': 'none',
-                    'Sec-Fetch-User': '?1',
-                    'Cache-Control': 'max-age=0'
-                },
-                geolocation={'latitude': 48.8566, 'longitude': 2.3522}  # Paris
-            )
-            
-            # Load cookies
-            logging.info("Loading cookies...")
-            cookies = load_leparisien_cookies(cookie_file, 'leparisien.fr', news_cookies_dir)
-            
-            if cookies:
-                logging.info(f"Adding {len(cookies)} cookies to active session...")
-                successful_cookies = 0
-                failed_cookies = 0
-                
-                for cookie in cookies:
-                    try:
-                        await context.add_cookies([cookie])
-                        successful_cookies += 1
-                        # Log important authentication cookies
-                        if any(key in cookie['name'].lower() for key in ['auth', 'session', 'subscription', 'premium', 'token', 'subscriber']):
-                            logging.info(f"✓ Added AUTH cookie: {cookie['name']}")
-                    except Exception as e:
-                        failed_cookies += 1
-                        logging.warning(f"❌ Failed to add cookie {cookie['name']}: {e}")
-                
-                logging.info(f"Cookie Summary: {successful_cookies} successful, {failed_cookies} failed")
-            
-            page = await context.new_page()
-            
-            # Your additional stealth measures
-            await page.add_init_script("""
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => undefined,
-                });
-                
-                Object.defineProperty(navigator, 'plugins', {
-                    get: () => [1, 2, 3, 4, 5],
-                });
-                
-                Object.defineProperty(navigator, 'languages', {
-                    get: () => ['fr-FR', 'fr', 'en'],
-                });
-                
-                window.chrome = {
-                    runtime: {},
-                };
-            """)
-            
+        # Load cookies
+        logging.info("Loading cookies...")
+        cookies = load_leparisien_cookies(cookie_file, 'leparisien.fr', news_cookies_dir)
+
+        cookie_path = os.path.join(news_cookies_dir, cookie_file)
+        try:
+            cookie_version = os.stat(cookie_path).st_mtime_ns
+        except OSError:
+            cookie_version = 0
+
+        # UA is picked once per pooled context so the fingerprint stays
+        # stable across requests from the same "device"
+        selected_ua = random.choice(_USER_AGENTS)
+        logging.info(f"🎭 Using User Agent: {selected_ua[:50]}...")
+
+        # Reuse the pooled Chromium: launch args, stealth script and cookies
+        # are applied once per cookie-file version instead of per URL
+        context = await browser_pool.get_context(
+            'leparisien',
+            version=cookie_version,
+            launch_args=_LAUNCH_ARGS,
+            cookies=cookies,
+            init_script=_STEALTH_INIT_JS,
+            user_agent=selected_ua,
+            viewport={'width': 1920, 'height': 1080},
+            device_scale_factor=1,
+            is_mobile=False,
+            has_touch=False,
+            locale='fr-FR',
+            timezone_id='Europe/Paris',
+            permissions=['geolocation'],
+            extra_http_headers={
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
+                'Accept-Language': 'fr-FR,fr;q=0.9,en;q=0.8',
+                'Accept-Encoding': 'gzip, deflate, br',
+                'DNT': '1',
+                'Connection': 'keep-alive',
+                'Upgrade-Insecure-Requests': '1',
+                'Sec-Fetch-Dest': 'document',
+                'Sec-Fetch-Mode': 'navigate',
+                'Sec-Fetch-Site': 'none',
+                'Sec-Fetch-User': '?1',
+                'Cache-Control': 'max-age=0'
+            },
+            geolocation={'latitude': 48.8566, 'longitude': 2.3522}  # Paris
+        )
+
+        page = await context.new_page()
+        try:
             logging.info(f"🌐 Loading: {url}")
-            
-            # Navigate with realistic timing
+
             await page.goto(url, wait_until='domcontentloaded', timeout=30000)
-            await page.wait_for_timeout(3000)
-            
-            # Extract title (your exact method)
-            title = None
-            title_selectors = [
-                "h1.title_xl",
-                "h1",
-                ".title_xl",
-                ".headline",
-                "[data-testid='headline']"
-            ]
-            
-            for selector in title_selectors:
-                try:
-                    title_element = page.locator(selector).first
-                    if await title_element.count() > 0:
-                        title = await title_element.text_content()
-                        if title:
-                            title = title.strip()
-                            # Clean up title
-                            title = re.sub(r'\s+', ' ', title)
-                            title = re.sub(r'&nbsp;', ' ', title)
-                            title = clean_leparisien_text(title)
-                            logging.info(f"✓ Title: {title}")
-                            break
-                except:
-                    continue
-            
-            # Extract first image (your exact method)
-            image_url = None
-            image_selectors = [
-                ".pos_rel img.image",
-                "img.image",
-                "img[src*='leparisien.fr']",
-                "img[src*='cloudfront-eu-central-1.images.arcpublishing.com']",
-                ".article-image img",
-                "figure img"
-            ]
-            
-            for selector in image_selectors:
-                try:
-                    img_element = page.locator(selector).first
-                    if await img_element.count() > 0:
-                        image_url = await img_element.get_attribute('src')
-                        if image_url:
-                            # Handle relative URLs
-                            if image_url.startswith('/'):
-                                image_url = f"https://www.leparisien.fr{image_url}"
-                            logging.info(f"✓ Image: {image_url}")
-                            break
-                except:
-                    continue
-            
-            # Extract article content (your exact method)
-            article_text = None
+
+            # Wait for the article container instead of a fixed 3s sleep;
+            # most pages are ready within a couple hundred ms
             try:
-                # Le Parisien article content selectors
-                content_selectors = [
-                    ".article-section",
-                    ".article-content",
-                    "[data-testid='article-body']",
-                    "main article"
-                ]
-                
-                article_container = None
-                for selector in content_selectors:
-                    try:
-                        container = page.locator(selector).first
-                        if await container.count() > 0:
-                            article_container = container
-                            logging.info(f"✓ Found article container with selector: {selector}")
-                            break
-                    except Exception as e:
-                        logging.warning(f"❌ Error with selector {selector}: {e}")
-                        continue
-                
-                if article_container:
-                    # Get all paragraphs and headings within content sections
-                    text_elements = await article_container.locator("section.content p, section.content h2, section.content h3").all()
-                    
-                    if text_elements:
-                        text_parts = []
-                        for element in text_elements:
-                            try:
-                                element_text = await element.text_content()
-                                if element_text and len(element_text.strip()) > 20:
-                                    # Skip Le Parisien UI elements and ads
-                                    if not any(skip_word in element_text.lower() for skip_word in [
-                                        'newsletter', 's\'inscrire', 'toutes les newsletters',
-                                        'à lire aussi', 'advertisement', 'google_ads',
-                                        'pubstack', 'arcad', 'adm-ad', 'abonnez-vous',
-                                        'un tour de l\'actualité', 'pour commencer la journée'
-                                    ]):
-                                        clean_text = clean_leparisien_text(element_text.strip())
-                                        if clean_text and len(clean_text) > 30:
-                                            text_parts.append(clean_text)
-                            except:
-                                continue
-                        
-                        if text_parts:
-                            article_text = ' '.join(text_parts)
-                            logging.info(f"✓ Extracted {len(text_parts)} text elements ({len(article_text)} chars)")
-                        else:
-                            logging.error("❌ No valid text elements found")
-                    else:
-                        logging.error("❌ No text elements found - trying fallback")
-                        
-                        # Fallback: extract all paragraphs with specific classes
-                        all_paragraphs = await article_container.locator("p.paragraph, p.lp-f-body-02").all()
-                        if all_paragraphs:
-                            text_parts = []
-                            for p in all_paragraphs:
-                                try:
-                                    p_text = await p.text_content()
-                                    if p_text and len(p_text.strip()) > 30:
-                                        clean_text = clean_leparisien_text(p_text.strip())
-                                        if clean_text and len(clean_text) > 30:
-                                            text_parts.append(clean_text)
-                                except:
-                                    continue
-                            
-                            if text_parts:
-                                article_text = ' '.join(text_parts)
-                                logging.info(f"✓ Fallback extracted {len(text_parts)} paragraphs ({len(article_text)} chars)")
-                            else:
-                                logging.error("❌ Fallback found no valid content")
-                        else:
-                            logging.error("❌ No paragraphs found in fallback")
-                else:
-                    logging.error("❌ Could not find article container")
-                    
-            except Exception as e:
-                logging.error(f"❌ Article extraction error: {e}")
-            
-            await browser.close()
-            
-            if article_text and len(article_text) > 100:
-                return {
-                    "title": title,
-                    "article": article_text,
-                    "image": image_url,
-                    "url": url
-                }
+                await page.wait_for_selector(_CONTENT_SELECTOR_UNION, timeout=3000)
+            except Exception:
+                await page.wait_for_timeout(1000)
+
+            # Grab the rendered HTML once and parse it in-process; fall back
+            # to the concurrent locator path when that comes up empty
+            parsed = _extract_leparisien_from_html(await page.content())
+            if parsed is not None:
+                title, image_url, article_text = parsed
             else:
-                logging.error(f"Le Parisien: Article text too short or empty - possible paywall issue")
-                return None
-                
+                # Title, image and body extraction are independent locator
+                # chains; run them concurrently so round-trips overlap
+                title, image_url, article_text = await asyncio.gather(
+                    _extract_leparisien_title(page),
+                    _extract_leparisien_image(page),
+                    _extract_leparisien_article_text(page)
+                )
+        finally:
+            await page.close()
+
+        if article_text and len(article_text) > 100:
+            return {
+                "title": title,
+                "article": article_text,
+                "image": image_url,
+                "url": url
+            }
+        else:
+            logging.error(f"Le Parisien: Article text too short or empty - possible paywall issue")
+            return None
+
     except Exception as e:
         logging.error(f"Le Parisien Playwright extraction failed: {e}")
         return None
@@ -383,4 +473,29 @@ async def extract_leparisien_article_with_playwright(url, news_cookies_dir, cook
 async def extract_leparisien_article(url, news_cookies_dir):
     """Main Le Parisien extraction function"""
     result = await extract_leparisien_article_with_playwright(url, news_cookies_dir)
-    return result 
\ No newline at end of file
+    return result
+
+async def extract_leparisien_batch(urls, news_cookies_dir, concurrency=4, timeout=30):
+    """Extract several Le Parisien articles concurrently against the pooled browser.
+
+    Parallelism is capped so Chromium isn't starved of tabs, each URL gets
+    its own timeout, and results come back in input order (None for URLs
+    that failed or timed out).
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _extract_one(url):
+        async with semaphore:
+            try:
+                return await asyncio.wait_for(
+                    extract_leparisien_article_with_playwright(url, news_cookies_dir),
+                    timeout
+                )
+            except Exception as e:
+                logging.error(f"Le Parisien batch extraction failed for {url}: {e}")
+                return None
+
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(_extract_one(url)) for url in urls]
+
+    return [task.result() for task in tasks] 
\ No newline at end of file
@@ -1,10 +1,12 @@
 import asyncio
-import http.cookiejar
+import html
 import os
 import re
 import logging
 from urllib.parse import urlparse, urljoin
-from playwright.async_api import async_playwright
+
+from Functions.browser_pool import browser_pool
+from Functions.cookies_util import parse_netscape_cookies
 
 # Le Point configuration
 LEPOINT_CONFIG = {
@@ -15,94 +17,189 @@ LEPOINT_CONFIG = {
     'wait_for_selector': 'h1'
 }
 
+# Precompiled helpers, parsed once at import instead of per clean call
+_WS_RE = re.compile(r'\s+')
+_TRAILING_PUNCT_RE = re.compile(r'\s*[|:]\s*$')
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+# Le Point specific cleaning patterns. Every lazy wildcard is bounded so a
+# missing anchor can't trigger quadratic backtracking across the whole article
+_LEPOINT_PATTERNS = (
+    # Newsletter signup sections
+    r'Le point du soir.{0,1500}?politique de confidentialité\.',
+    r'Tous les soirs à partir de 18h.{0,1500}?Votre inscription a bien été prise en compte',
+    r'Recevez l\'information analysée et décryptée.{0,800}?MonCompte',
+    r'En vous inscrivant, vous acceptez.{0,800}?politique de confidentialité\.',
+
+    # Reading suggestions and capsules
+    r'À LIRE AUSSI.{0,400}?(?=\s[A-Z]|\.|$)',
+    r'À Découvrir.{0,800}?Répondre',
+    r'Le Kangourou du jour.{0,800}?Répondre',
+
+    # Ad and promotional content
+    r'Merci !.{0,800}?MonCompte',
+    r'Votre adresse email n\'est pas valide',
+    r'Veuillez renseigner votre adresse email',
+    r'S\'inscrire',
+
+    # Common Le Point footer elements
+    r'conditions générales d\'utilisations',
+    r'politique de confidentialité'
+)
+
+# All removal patterns fused into one alternation so cleaning is a single
+# scan of the text instead of one full pass per pattern
+_LEPOINT_COMBINED = re.compile('|'.join(f'(?:{p})' for p in _LEPOINT_PATTERNS), re.IGNORECASE | re.DOTALL)
+
+# Cheap probe with one literal cue per removal pattern: most body paragraphs
+# contain none of them, so the heavy combined pass can be skipped entirely
+_LEPOINT_AD_PROBE = re.compile(
+    r"(?i)le point du soir|tous les soirs|recevez l|en vous inscrivant"
+    r"|à lire aussi|à découvrir|kangourou|merci !|adresse email|s'inscrire"
+    r"|conditions générales|politique de confidentialité"
+)
+
 def clean_lepoint_text(text):
     """Clean Le Point article text to remove unwanted content"""
     if not text:
         return None
-    
+
     # Ensure text is properly decoded as UTF-8
     if isinstance(text, bytes):
         text = text.decode('utf-8', errors='ignore')
-    
+
     # Normalize whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
-    
-    # Le Point specific cleaning patterns
-    patterns_to_remove = [
-        # Newsletter signup sections
-        r'Le point du soir.*?politique de confidentialité\.',
-        r'Tous les soirs à partir de 18h.*?Votre inscription a bien été prise en compte',
-        r'Recevez l\'information analysée et décryptée.*?MonCompte',
-        r'En vous inscrivant, vous acceptez.*?politique de confidentialité\.',
-        
-        # Reading suggestions and capsules
-        r'À LIRE AUSSI.*?(?=\s[A-Z]|\.|$)',
-        r'À Découvrir.*?Répondre',
-        r'Le Kangourou du jour.*?Répondre',
-        
-        # Ad and promotional content
-        r'Merci !.*?MonCompte',
-        r'Votre adresse email n\'est pas valide',
-        r'Veuillez renseigner votre adresse email',
-        r'S\'inscrire',
-        
-        # Common Le Point footer elements
-        r'conditions générales d\'utilisations',
-        r'politique de confidentialité',
-        
-        # Clean HTML artifacts
-        r'&nbsp;',
-        r'&amp;',
-        r'&quot;',
-        r'&lt;',
-        r'&gt;',
-        r'&apos;'
-    ]
-    
-    for pattern in patterns_to_remove:
-        text = re.sub(pattern, '', text, flags=re.IGNORECASE | re.DOTALL)
-    
+    text = _WS_RE.sub(' ', text).strip()
+
+    # Le Point specific cleaning patterns, gated on the probe so clean
+    # paragraphs skip the combined pass
+    if _LEPOINT_AD_PROBE.search(text):
+        text = _LEPOINT_COMBINED.sub('', text)
+        text = _WS_RE.sub(' ', text).strip()
+
     # General cleaning
-    text = re.sub(r'\s*[|:]\s*$', '', text)
-    text = re.sub(r'\s+', ' ', text).strip()
-    
-    # Clean up common HTML entities
-    text = text.replace('&nbsp;', ' ').replace('&amp;', '&').replace('&quot;', '"')
-    text = text.replace('&lt;', '<').replace('&gt;', '>').replace('&apos;', "'")
-    
+    text = _TRAILING_PUNCT_RE.sub('', text)
+
+    # Decode HTML entities (handles named and numeric forms in one C pass)
+    text = html.unescape(text)
+
     return text if len(text) > 50 else None
 
+# Parsed cookie lists keyed by (path, mtime_ns, domain) — the same file is
+# reloaded for every article, and mtime invalidates the entry on refresh
+_COOKIE_CACHE = {}
+
 def load_lepoint_cookies(cookie_file, domain):
     """Load cookies from Netscape format file for Le Point"""
     if not os.path.exists(cookie_file):
         logging.warning(f"Le Point cookie file not found: {cookie_file}")
         return []
-        
+
+    key = (cookie_file, os.stat(cookie_file).st_mtime_ns, domain)
+    cached = _COOKIE_CACHE.get(key)
+    if cached is not None:
+        return list(cached)
+
     try:
-        jar = http.cookiejar.MozillaCookieJar()
-        jar.load(cookie_file, ignore_discard=True, ignore_expires=True)
-        
-        cookies = []
-        for cookie in jar:
-            if domain in cookie.domain or cookie.domain in domain:
-                cookies.append({
-                    "name": cookie.name,
-                    "value": cookie.value,
-                    "domain": cookie.domain,
-                    "path": cookie.path,
-                    "expires": cookie.expires if cookie.expires else -1,
-                    "httpOnly": bool(cookie._rest.get("HttpOnly", False)),
-                    "secure": cookie.secure,
-                    "sameSite": "Lax"
-                })
-        
+        # Same straight split-on-tab parser Le Parisien uses, instead of
+        # MozillaCookieJar's RFC-heavy pure-Python machinery
+        cookies = parse_netscape_cookies(cookie_file, domain_filter=domain)
+
         logging.info(f"Loaded {len(cookies)} cookies for Le Point ({domain})")
-        return cookies
-        
+        _COOKIE_CACHE[key] = cookies
+        return list(cookies)
+
     except Exception as e:
         logging.error(f"Error loading Le Point cookies from {cookie_file}: {e}")
         return []
 
+async def _extract_lepoint_title(page):
+    """Extract and clean the Le Point article title"""
+    try:
+        title_element = await page.query_selector(LEPOINT_CONFIG["title_selector"])
+        if title_element:
+            title_html = await title_element.inner_html()
+            # Remove HTML tags but keep text
+            title = _HTML_TAG_RE.sub('', title_html).strip()
+            # Clean up HTML entities
+            title = title.replace('&nbsp;', ' ').replace('&amp;', '&')
+            logging.info(f"Le Point title extracted: {title}")
+            return title
+    except Exception as e:
+        logging.error(f"Le Point title extraction error: {e}")
+
+    return None
+
+# In-browser collection of candidate paragraphs: the container probe, the
+# ad/newsletter class filter and the text harvesting all happen in a single
+# evaluate round-trip instead of several CDP calls per paragraph
+_LEPOINT_TEXT_JS = """() => {
+    // Compiled multi-pattern matcher: one scan per class string instead of
+    // a lowercase copy plus one includes() scan per skip class
+    const skipRe = /slotpub|newsletter|capsule|advertisement|teads|bloc-1/i;
+    const container = document.querySelector('#contenu.article-styles');
+    const nodes = container ? container.querySelectorAll('p') : document.querySelectorAll('p');
+    const out = [];
+    nodes.forEach(n => {
+        if (skipRe.test(n.closest('[class]')?.className || '')) return;
+        const t = (n.textContent || '').trim();
+        if (t.length > 30) out.push(t);
+    });
+    return {found: !!container, texts: out};
+}"""
+
+async def _extract_lepoint_article_text(page):
+    """Extract and clean the Le Point article body"""
+    try:
+        data = await page.evaluate(_LEPOINT_TEXT_JS)
+        if not data["found"]:
+            logging.warning("Le Point: Article container not found")
+
+        if data["texts"]:
+            paragraphs = []
+            for text in data["texts"]:
+                clean_paragraph = clean_lepoint_text(text)
+                if clean_paragraph and len(clean_paragraph) > 30:
+                    paragraphs.append(clean_paragraph)
+
+            if paragraphs:
+                article_text = ' '.join(paragraphs)
+                logging.info(f"Le Point: Extracted {len(paragraphs)} paragraphs ({len(article_text)} chars)")
+                return article_text
+
+            logging.warning("Le Point: No valid paragraphs found")
+        else:
+            logging.warning("Le Point: No paragraph elements found")
+
+    except Exception as e:
+        logging.error(f"Le Point article extraction error: {e}")
+
+    return None
+
+async def _extract_lepoint_image(page, url):
+    """Extract the first Le Point article image URL"""
+    try:
+        image_element = await page.query_selector(LEPOINT_CONFIG["image_selector"])
+        if image_element:
+            image_url = await image_element.get_attribute('src')
+            # Handle relative URLs: cover the common protocol-relative and
+            # path-relative cases with plain concatenation, and only fall
+            # back to a full urljoin parse for anything exotic
+            if image_url and image_url[:4] != 'http':
+                if image_url[:2] == '//':
+                    image_url = 'https:' + image_url
+                elif image_url[:1] == '/':
+                    parsed = urlparse(url)
+                    image_url = f"{parsed.scheme}://{parsed.hostname}{image_url}"
+                else:
+                    image_url = urljoin(url, image_url)
+            logging.info(f"Le Point image extracted: {image_url}")
+            return image_url
+    except Exception as e:
+        logging.error(f"Le Point image extraction error: {e}")
+
+    return None
+
 async def extract_lepoint_article(url, news_cookies_dir):
     """Extract article content using Playwright for Le Point"""
     # Fix malformed URLs missing protocol
@@ -121,27 +218,29 @@ async def extract_lepoint_article(url, news_cookies_dir):
         cookie_file = os.path.join(news_cookies_dir, f"{domain}_cookies.txt")
     
     cookies = load_lepoint_cookies(cookie_file, domain)
-    
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(
-            headless=True,
-            args=['--disable-blink-features=AutomationControlled']
-        )
-        
-        context = await browser.new_context(
+
+    try:
+        cookie_version = os.stat(cookie_file).st_mtime_ns
+    except OSError:
+        cookie_version = 0
+
+    try:
+        # Reuse the pooled Chromium; cookies are installed once per
+        # cookie-file version instead of per URL
+        context = await browser_pool.get_context(
+            'lepoint',
+            version=cookie_version,
+            launch_args=('--disable-blink-features=AutomationControlled',),
+            cookies=cookies,
             user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         )
-        
+
+        page = await context.new_page()
         try:
-            if cookies:
-                await context.add_cookies(cookies)
-            
-            page = await context.new_page()
-            
             logging.info(f"Loading Le Point URL: {url}")
             # Use domcontentloaded instead of networkidle for Le Point
             await page.goto(url, wait_until='domcontentloaded', timeout=15000)
-            
+
             # Wait for content to load with shorter timeout
             try:
                 await page.wait_for_selector(LEPOINT_CONFIG["wait_for_selector"], timeout=5000)
@@ -149,86 +248,27 @@ async def extract_lepoint_article(url, news_cookies_dir):
                 # Fallback - wait a bit longer and try again
                 await page.wait_for_timeout(3000)
                 await page.wait_for_selector(LEPOINT_CONFIG["wait_for_selector"], timeout=3000)
-            
-            # Extract title
-            title = None
-            try:
-                title_element = await page.query_selector(LEPOINT_CONFIG["title_selector"])
-                if title_element:
-                    title_html = await title_element.inner_html()
-                    # Remove HTML tags but keep text
-                    title = re.sub(r'<[^>]+>', '', title_html).strip()
-                    # Clean up HTML entities
-                    title = title.replace('&nbsp;', ' ').replace('&amp;', '&')
-                    logging.info(f"Le Point title extracted: {title}")
-            except Exception as e:
-                logging.error(f"Le Point title extraction error: {e}")
-            
-            # Extract article paragraphs
-            article_text = None
-            try:
-                # First check if article container exists
-                container = await page.query_selector(LEPOINT_CONFIG["article_container_selector"])
-                if not container:
-                    logging.warning("Le Point: Article container not found")
-                    # Fallback to body paragraphs
-                    paragraph_elements = await page.query_selector_all("p")
-                else:
-                    paragraph_elements = await page.query_selector_all(LEPOINT_CONFIG["paragraphs_selector"])
-                
-                if paragraph_elements:
-                    paragraphs = []
-                    for element in paragraph_elements:
-                        # Skip ad containers, newsletter forms, and other unwanted elements
-                        parent_classes = await element.evaluate('el => el.closest("[class]")?.className || ""')
-                        if any(skip_class in parent_classes.lower() for skip_class in [
-                            'slotpub', 'newsletter', 'capsule', 'advertisement', 'teads', 'bloc-1'
-                        ]):
-                            continue
-                        
-                        text = await element.text_content()
-                        if text and len(text.strip()) > 30:  # Only substantial paragraphs
-                            clean_paragraph = clean_lepoint_text(text.strip())
-                            if clean_paragraph and len(clean_paragraph) > 30:
-                                paragraphs.append(clean_paragraph)
-                    
-                    if paragraphs:
-                        article_text = ' '.join(paragraphs)
-                        logging.info(f"Le Point: Extracted {len(paragraphs)} paragraphs ({len(article_text)} chars)")
-                    else:
-                        logging.warning("Le Point: No valid paragraphs found")
-                else:
-                    logging.warning("Le Point: No paragraph elements found")
-                    
-            except Exception as e:
-                logging.error(f"Le Point article extraction error: {e}")
-            
-            # Extract image
-            image_url = None
-            try:
-                image_element = await page.query_selector(LEPOINT_CONFIG["image_selector"])
-                if image_element:
-                    image_url = await image_element.get_attribute('src')
-                    # Handle relative URLs
-                    if image_url and not image_url.startswith('http'):
-                        image_url = urljoin(url, image_url)
-                    logging.info(f"Le Point image extracted: {image_url}")
-            except Exception as e:
-                logging.error(f"Le Point image extraction error: {e}")
-            
-            await browser.close()
-            
-            if not article_text:
-                raise ValueError("No Le Point article content extracted")
-            
-            return {
-                "title": title or "Unknown Title",
-                "article": article_text,
-                "image": image_url,
-                "url": url,
-                "domain": domain
-            }
-            
-        except Exception as e:
-            await browser.close()
-            raise Exception(f"Le Point Playwright extraction failed: {str(e)}") 
\ No newline at end of file
+
+            # Title, body and image extraction are independent query chains;
+            # run them concurrently so their browser round-trips overlap
+            title, article_text, image_url = await asyncio.gather(
+                _extract_lepoint_title(page),
+                _extract_lepoint_article_text(page),
+                _extract_lepoint_image(page, url)
+            )
+        finally:
+            await page.close()
+
+        if not article_text:
+            raise ValueError("No Le Point article content extracted")
+
+        return {
+            "title": title or "Unknown Title",
+            "article": article_text,
+            "image": image_url,
+            "url": url,
+            "domain": domain
+        }
+
+    except Exception as e:
+        raise Exception(f"Le Point Playwright extraction failed: {str(e)}")
\ No newline at end of file
@@ -1,10 +1,34 @@
 import asyncio
-import http.cookiejar
+import html
 import os
 import re
 import logging
 from urllib.parse import urlparse, urljoin
-from playwright.async_api import async_playwright
+
+from Functions.browser_pool import browser_pool
+from Functions.cookies_util import parse_netscape_cookies
+
+# Optional fast path: plain HTTP + C HTML parsing, no Chromium involved
+try:
+    import httpx
+    from selectolax.parser import HTMLParser
+    FAST_PATH_AVAILABLE = True
+except ImportError:
+    FAST_PATH_AVAILABLE = False
+
+# Shared browser fingerprint for the fast path and the Playwright context
+LETEMPS_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+# Resource types that only matter for visual rendering; aborting them cuts
+# most of the page weight while the image URL stays readable from the DOM
+_BLOCKED_RESOURCE_TYPES = {'image', 'media', 'font', 'stylesheet'}
+
+async def _block_heavy_resources(route, request):
+    """Abort image/media/font/css requests; the text doesn't need them"""
+    if request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
 
 # Le Temps configuration
 LETEMPS_CONFIG = {
@@ -16,101 +40,194 @@ LETEMPS_CONFIG = {
     'wait_for_selector': 'h1.post__title'
 }
 
+# Precompiled helper shared by the cleaner below
+_TAIL_RE = re.compile(r'\s*[|:]\s*$')
+
+# Le Temps specific cleaning patterns, compiled once at import
+_LETEMPS_PATTERNS = (
+    # Newsletter signup sections
+    r'Newsletter.*?Chaque vendredi.*?S\'inscrire',
+    r'Pour recevoir notre newsletter.*?Créer mon compte',
+    r'Chaque vendredi matin.*?de la semaine\.',
+
+    # Account/subscription prompts
+    r'Créez-vous un compte gratuitement.*?sauvegardés\.',
+    r'Déjà un compte.*?Se connecter',
+    r'Créer mon compte',
+
+    # Share and social media elements
+    r'Partager.*?Twitter',
+    r'Copier le lien',
+    r'Lire plus tard',
+    r'S\'inscrire',
+
+    # Reading time and metadata
+    r'\d+ min\. de lecture',
+    r'Publié le.*?Modifié le.*?\.',
+
+    # Ad and promotional content
+    r'CHF \d+\.- le 1er mois',
+    r'J\'en profite →',
+    r'Suivez les résultats.*?⚽',
+
+    # Newsletter widget content
+    r'If you are a human, ignore this field'
+)
+
+# All removal patterns fused into one alternation so cleaning is a single
+# pass over the text instead of one full scan per pattern
+_LETEMPS_CLEAN_RE = re.compile('|'.join(f'(?:{p})' for p in _LETEMPS_PATTERNS), re.IGNORECASE | re.DOTALL)
+
+# Ad/newsletter container filter: one case-insensitive scan of the class
+# string instead of a lowercase copy plus one substring pass per skip word
+_LETEMPS_SKIP_RE = re.compile(r'newsletter|share-button|advertisement|banner|promo', re.IGNORECASE)
+
 def clean_letemps_text(text):
     """Clean Le Temps article text to remove unwanted content"""
     if not text:
         return None
-    
+
     # Ensure text is properly decoded as UTF-8
     if isinstance(text, bytes):
         text = text.decode('utf-8', errors='ignore')
-    
-    # Normalize whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
-    
-    # Le Temps specific cleaning patterns
-    patterns_to_remove = [
-        # Newsletter signup sections
-        r'Newsletter.*?Chaque vendredi.*?S\'inscrire',
-        r'Pour recevoir notre newsletter.*?Créer mon compte',
-        r'Chaque vendredi matin.*?de la semaine\.',
-        
-        # Account/subscription prompts
-        r'Créez-vous un compte gratuitement.*?sauvegardés\.',
-        r'Déjà un compte.*?Se connecter',
-        r'Créer mon compte',
-        
-        # Share and social media elements
-        r'Partager.*?Twitter',
-        r'Copier le lien',
-        r'Lire plus tard',
-        r'S\'inscrire',
-        
-        # Reading time and metadata
-        r'\d+ min\. de lecture',
-        r'Publié le.*?Modifié le.*?\.',
-        
-        # Ad and promotional content
-        r'CHF \d+\.- le 1er mois',
-        r'J\'en profite →',
-        r'Suivez les résultats.*?⚽',
-        
-        # Newsletter widget content
-        r'If you are a human, ignore this field',
-        
-        # Clean HTML artifacts and entities
-        r'&nbsp;',
-        r'&amp;',
-        r'&quot;',
-        r'&lt;',
-        r'&gt;',
-        r'&apos;'
-    ]
-    
-    for pattern in patterns_to_remove:
-        text = re.sub(pattern, '', text, flags=re.IGNORECASE | re.DOTALL)
-    
+
+    # Too short to survive the final >30 check even before cleanup shrinks
+    # it further - skip the regex pipeline entirely
+    if len(text) < 40:
+        return None
+
+    # Normalize whitespace (str.split collapses any whitespace run in C)
+    text = ' '.join(text.split())
+
+    # Le Temps specific cleaning patterns, all applied in one pass
+    text = _LETEMPS_CLEAN_RE.sub('', text)
+
     # General cleaning
-    text = re.sub(r'\s*[|:]\s*$', '', text)
-    text = re.sub(r'\s+', ' ', text).strip()
-    
-    # Clean up common HTML entities
-    text = text.replace('&nbsp;', ' ').replace('&amp;', '&').replace('&quot;', '"')
-    text = text.replace('&lt;', '<').replace('&gt;', '>').replace('&apos;', "'")
-    
+    text = _TAIL_RE.sub('', text)
+    text = ' '.join(text.split())
+
+    # Decode HTML entities (handles named and numeric forms in one C pass);
+    # previously the entities were deleted by the pattern loop before the
+    # replace chain could ever substitute them
+    text = html.unescape(text)
+
     return text if len(text) > 30 else None
 
+# Parsed cookie lists keyed by (path, mtime_ns, domain) — the same file is
+# reloaded for every article, and mtime invalidates the entry on refresh
+_COOKIE_CACHE = {}
+
 def load_letemps_cookies(cookie_file, domain):
     """Load cookies from Netscape format file for Le Temps"""
     if not os.path.exists(cookie_file):
         logging.warning(f"Le Temps cookie file not found: {cookie_file}")
         return []
-        
+
+    key = (cookie_file, os.stat(cookie_file).st_mtime_ns, domain)
+    cached = _COOKIE_CACHE.get(key)
+    if cached is not None:
+        return list(cached)
+
     try:
-        jar = http.cookiejar.MozillaCookieJar()
-        jar.load(cookie_file, ignore_discard=True, ignore_expires=True)
-        
-        cookies = []
-        for cookie in jar:
-            if domain in cookie.domain or cookie.domain in domain:
-                cookies.append({
-                    "name": cookie.name,
-                    "value": cookie.value,
-                    "domain": cookie.domain,
-                    "path": cookie.path,
-                    "expires": cookie.expires if cookie.expires else -1,
-                    "httpOnly": bool(cookie._rest.get("HttpOnly", False)),
-                    "secure": cookie.secure,
-                    "sameSite": "Lax"
-                })
-        
+        # Same shared split-on-tab parser the other extractors use, instead
+        # of MozillaCookieJar's RFC-heavy pure-Python machinery
+        cookies = parse_netscape_cookies(cookie_file, domain_filter=domain)
+
         logging.info(f"Loaded {len(cookies)} cookies for Le Temps ({domain})")
-        return cookies
-        
+        _COOKIE_CACHE[key] = cookies
+        return list(cookies)
+
     except Exception as e:
         logging.error(f"Error loading Le Temps cookies from {cookie_file}: {e}")
         return []
 
+# In-browser harvest of everything the extractor needs: title, lead, body
+# paragraphs (with their ancestor classes for the skip filter) and cover
+# image come back in a single evaluate round-trip instead of two CDP
+# messages per paragraph plus separate title/lead/image queries. The
+# selectors mirror LETEMPS_CONFIG.
+_LETEMPS_HARVEST_JS = """() => {
+    const titleEl = document.querySelector('h1.post__title');
+    const leadEl = document.querySelector('.post__lead p');
+    const imgEl = document.querySelector('.post__cover img');
+    const paragraphs = Array.from(document.querySelectorAll('.post-body p')).map(el => ({
+        text: el.textContent || '',
+        pc: (el.closest('[class]') || {}).className || ''
+    }));
+    return {
+        title: titleEl ? titleEl.textContent : null,
+        lead: leadEl ? leadEl.textContent : null,
+        image: imgEl ? (imgEl.getAttribute('data-src') || imgEl.getAttribute('src')) : null,
+        paragraphs: paragraphs
+    };
+}"""
+
+async def _try_letemps_fast_path(url, domain, cookies):
+    """Try extracting with httpx + selectolax, skipping Playwright entirely.
+
+    Le Temps articles are server-rendered, so the markup is usually present
+    in the raw HTML. Returns None when the selectors come up empty, in
+    which case the caller falls back to the full Playwright extraction.
+    """
+    if not FAST_PATH_AVAILABLE:
+        return None
+
+    try:
+        cookie_jar = {c["name"]: c["value"] for c in cookies}
+        async with httpx.AsyncClient(cookies=cookie_jar, follow_redirects=True, timeout=10) as client:
+            response = await client.get(url, headers={"User-Agent": LETEMPS_USER_AGENT})
+        if response.status_code != 200:
+            return None
+
+        tree = HTMLParser(response.text)
+
+        if tree.css_first(LETEMPS_CONFIG["article_body_selector"]) is None:
+            return None
+
+        title_node = tree.css_first(LETEMPS_CONFIG["title_selector"])
+        title = title_node.text(strip=True) if title_node else None
+        if not title:
+            return None
+
+        paragraphs = []
+
+        lead_node = tree.css_first(LETEMPS_CONFIG["lead_selector"])
+        if lead_node:
+            lead_text = clean_letemps_text(lead_node.text().strip())
+            if lead_text and len(lead_text) > 30:
+                paragraphs.append(lead_text)
+
+        for node in tree.css(LETEMPS_CONFIG["paragraphs_selector"]):
+            text = node.text().strip()
+            if len(text) > 30:
+                clean_paragraph = clean_letemps_text(text)
+                if clean_paragraph and len(clean_paragraph) > 30:
+                    paragraphs.append(clean_paragraph)
+
+        if not paragraphs:
+            return None
+        article_text = ' '.join(paragraphs)
+
+        image_url = None
+        image_node = tree.css_first(LETEMPS_CONFIG["image_selector"])
+        if image_node:
+            image_url = image_node.attributes.get('data-src') or image_node.attributes.get('src')
+            if image_url and not image_url.startswith('http'):
+                image_url = urljoin(url, image_url)
+
+        logging.info(f"Le Temps: fast path extracted article ({len(article_text)} chars)")
+        return {
+            "title": title,
+            "article": article_text,
+            "image": image_url,
+            "url": url,
+            "domain": domain
+        }
+
+    except Exception as e:
+        logging.info(f"Le Temps fast path failed, falling back to Playwright: {e}")
+        return None
+
 async def extract_letemps_article(url, news_cookies_dir):
     """Extract article content using Playwright for Le Temps"""
     # Fix malformed URLs missing protocol
@@ -119,8 +236,17 @@ async def extract_letemps_article(url, news_cookies_dir):
     elif not url.startswith(('http://', 'https://')):
         url = 'https://' + url
     
-    domain = urlparse(url).hostname
-    if not domain or 'letemps.ch' not in domain:
+    # Hostname via plain C string ops: strip the scheme, cut at the first
+    # path/query/fragment delimiter, then drop userinfo and port; urlparse's
+    # full state machine only runs as a fallback for exotic forms
+    domain = url.split('://', 1)[-1]
+    for sep in '/?#':
+        domain = domain.split(sep, 1)[0]
+    domain = domain.split('@')[-1].split(':')[0].lower()
+    if not domain:
+        domain = urlparse(url).hostname
+    # Suffix check, not substring: "letemps.ch" in "fakeletemps.ch.evil" is True
+    if not domain or not domain.endswith('letemps.ch'):
         raise ValueError("Invalid Le Temps URL")
     
     # Find cookie file for Le Temps
@@ -129,120 +255,128 @@ async def extract_letemps_article(url, news_cookies_dir):
         cookie_file = os.path.join(news_cookies_dir, f"{domain}_cookies.txt")
     
     cookies = load_letemps_cookies(cookie_file, domain)
-    
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(
-            headless=True,
-            args=['--disable-blink-features=AutomationControlled']
-        )
-        
-        context = await browser.new_context(
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        )
-        
-        try:
-            if cookies:
-                await context.add_cookies(cookies)
-            
+
+    # Try the cheap HTTP path first; only touch Chromium when it fails
+    fast_result = await _try_letemps_fast_path(url, domain, cookies)
+    if fast_result is not None:
+        return fast_result
+
+    try:
+        cookie_version = os.stat(cookie_file).st_mtime_ns
+    except OSError:
+        cookie_version = 0
+
+    try:
+        title = None
+        article_text = None
+        image_url = None
+
+        for js_enabled in (False, True):
+            # The markup is server-rendered, so the first attempt skips V8
+            # (no analytics/ad script parsing or execution at all); a
+            # JS-enabled context - cached under its own site key - is only
+            # used if the title never appears without scripts
+            context = await browser_pool.get_context(
+                'letemps-js' if js_enabled else 'letemps',
+                version=cookie_version,
+                launch_args=('--disable-blink-features=AutomationControlled',),
+                cookies=cookies,
+                route=('**/*', _block_heavy_resources),
+                user_agent=LETEMPS_USER_AGENT,
+                java_script_enabled=js_enabled
+            )
+
             page = await context.new_page()
-            
-            logging.info(f"Loading Le Temps URL: {url}")
-            # Use domcontentloaded for Le Temps as well
-            await page.goto(url, wait_until='domcontentloaded', timeout=15000)
-            
-            # Wait for content to load with shorter timeout
-            try:
-                await page.wait_for_selector(LETEMPS_CONFIG["wait_for_selector"], timeout=5000)
-            except:
-                # Fallback - wait a bit longer and try again
-                await page.wait_for_timeout(3000)
-                await page.wait_for_selector(LETEMPS_CONFIG["wait_for_selector"], timeout=3000)
-            
-            # Extract title
-            title = None
-            try:
-                title_element = await page.query_selector(LETEMPS_CONFIG["title_selector"])
-                if title_element:
-                    title = (await title_element.text_content()).strip()
-                    logging.info(f"Le Temps title extracted: {title}")
-            except Exception as e:
-                logging.error(f"Le Temps title extraction error: {e}")
-            
-            # Extract article paragraphs
-            article_text = None
             try:
-                # First get the lead/summary
-                lead_text = None
+                logging.info(f"Loading Le Temps URL: {url}")
+                # Use domcontentloaded for Le Temps as well
+                await page.goto(url, wait_until='domcontentloaded', timeout=15000)
+
+                # Wait for the title to be attached to the DOM; 'attached'
+                # resolves as soon as the node exists, without layout or
+                # visibility checks, so no sleep-and-retry ladder is needed
                 try:
-                    lead_element = await page.query_selector(LETEMPS_CONFIG["lead_selector"])
-                    if lead_element:
-                        lead_text = await lead_element.text_content()
-                        lead_text = clean_letemps_text(lead_text.strip()) if lead_text else None
-                except Exception as e:
-                    logging.warning(f"Le Temps lead extraction warning: {e}")
-                
-                # Then get the main article body paragraphs
-                paragraph_elements = await page.query_selector_all(LETEMPS_CONFIG["paragraphs_selector"])
-                
-                if paragraph_elements:
-                    paragraphs = []
-                    
-                    # Add lead text first if available
-                    if lead_text and len(lead_text) > 30:
-                        paragraphs.append(lead_text)
-                    
-                    for element in paragraph_elements:
-                        # Skip ad containers and other unwanted elements
-                        parent_classes = await element.evaluate('el => el.closest("[class]")?.className || ""')
-                        if any(skip_class in parent_classes.lower() for skip_class in [
-                            'newsletter', 'share-button', 'advertisement', 'banner', 'promo'
-                        ]):
-                            continue
-                        
-                        text = await element.text_content()
-                        if text and len(text.strip()) > 30:  # Only substantial paragraphs
-                            clean_paragraph = clean_letemps_text(text.strip())
-                            if clean_paragraph and len(clean_paragraph) > 30:
-                                paragraphs.append(clean_paragraph)
-                    
-                    if paragraphs:
-                        article_text = ' '.join(paragraphs)
-                        logging.info(f"Le Temps: Extracted {len(paragraphs)} paragraphs ({len(article_text)} chars)")
+                    await page.wait_for_selector(LETEMPS_CONFIG["wait_for_selector"], state='attached', timeout=8000)
+                except Exception:
+                    if not js_enabled:
+                        logging.info("Le Temps: title missing without JS, retrying with scripts enabled")
+                        continue
+                    raise
+
+                # Harvest title, lead, paragraphs and image in one evaluate call
+                try:
+                    data = await page.evaluate(_LETEMPS_HARVEST_JS)
+
+                    if data["title"]:
+                        title = data["title"].strip()
+                        logging.info(f"Le Temps title extracted: {title}")
+
+                    # Lead/summary first, then the main body paragraphs
+                    lead_text = clean_letemps_text(data["lead"].strip()) if data["lead"] else None
+
+                    if data["paragraphs"]:
+                        paragraphs = []
+
+                        # Add lead text first if available
+                        if lead_text and len(lead_text) > 30:
+                            paragraphs.append(lead_text)
+
+                        for item in data["paragraphs"]:
+                            # Skip ad containers and other unwanted elements
+                            if _LETEMPS_SKIP_RE.search(item["pc"]):
+                                continue
+
+                            text = item["text"]
+                            if text and len(text.strip()) > 30:  # Only substantial paragraphs
+                                clean_paragraph = clean_letemps_text(text.strip())
+                                if clean_paragraph and len(clean_paragraph) > 30:
+                                    paragraphs.append(clean_paragraph)
+
+                        if paragraphs:
+                            article_text = ' '.join(paragraphs)
+                            logging.info(f"Le Temps: Extracted {len(paragraphs)} paragraphs ({len(article_text)} chars)")
+                        else:
+                            logging.warning("Le Temps: No valid paragraphs found")
                     else:
-                        logging.warning("Le Temps: No valid paragraphs found")
-                else:
-                    logging.warning("Le Temps: No paragraph elements found")
-                    
-            except Exception as e:
-                logging.error(f"Le Temps article extraction error: {e}")
-            
-            # Extract image
-            image_url = None
-            try:
-                image_element = await page.query_selector(LETEMPS_CONFIG["image_selector"])
-                if image_element:
-                    # Try data-src first (lazy loading), then src
-                    image_url = await image_element.get_attribute('data-src') or await image_element.get_attribute('src')
+                        logging.warning("Le Temps: No paragraph elements found")
+
+                    image_url = data["image"]
                     # Handle relative URLs
                     if image_url and not image_url.startswith('http'):
                         image_url = urljoin(url, image_url)
-                    logging.info(f"Le Temps image extracted: {image_url}")
-            except Exception as e:
-                logging.error(f"Le Temps image extraction error: {e}")
-            
-            await browser.close()
-            
-            if not article_text:
-                raise ValueError("No Le Temps article content extracted")
-            
-            return {
-                "title": title or "Unknown Title",
-                "article": article_text,
-                "image": image_url,
-                "url": url,
-                "domain": domain
-            }
-            
-        except Exception as e:
-            await browser.close()
-            raise Exception(f"Le Temps Playwright extraction failed: {str(e)}") 
\ No newline at end of file
+                    if image_url:
+                        logging.info(f"Le Temps image extracted: {image_url}")
+
+                except Exception as e:
+                    logging.error(f"Le Temps article extraction error: {e}")
+            finally:
+                await page.close()
+            break
+
+        if not article_text:
+            raise ValueError("No Le Temps article content extracted")
+
+        return {
+            "title": title or "Unknown Title",
+            "article": article_text,
+            "image": image_url,
+            "url": url,
+            "domain": domain
+        }
+
+    except Exception as e:
+        raise Exception(f"Le Temps Playwright extraction failed: {str(e)}")
+
+async def extract_letemps_batch(urls, news_cookies_dir, concurrency=4):
+    """Extract several Le Temps articles concurrently against the pooled browser.
+
+    Parallelism is capped so Chromium isn't starved of tabs; failures come
+    back as exception objects in the result list (input order preserved).
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _extract_one(url):
+        async with semaphore:
+            return await extract_letemps_article(url, news_cookies_dir)
+
+    return await asyncio.gather(*(_extract_one(url) for url in urls), return_exceptions=True)
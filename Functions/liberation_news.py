@@ -3,108 +3,237 @@ import logging
 import re
 import os
 import random
-from playwright.async_api import async_playwright
 from urllib.parse import urljoin, urlparse
 
-def parse_netscape_cookies(file_path):
-    """Parse Netscape cookie file format - your exact approach with proper Playwright format"""
-    cookies = []
-    try:
-        with open(file_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line.startswith('#') or not line:
-                    continue
-                
-                parts = line.split('\t')
-                if len(parts) >= 7:
-                    domain = parts[0]
-                    domain_flag = parts[1] == 'TRUE'
-                    path = parts[2]
-                    secure = parts[3] == 'TRUE'
-                    expires = parts[4]
-                    name = parts[5]
-                    value = parts[6]
-                    
-                    # Convert expires timestamp
-                    expires_timestamp = None
-                    if expires != '-1' and expires.isdigit():
-                        expires_timestamp = int(expires)
-                    
-                    cookie = {
-                        'name': name,
-                        'value': value,
-                        'domain': domain,
-                        'path': path,
-                        'secure': secure
-                    }
-                    
-                    # Add expires if not session cookie
-                    if expires_timestamp:
-                        cookie['expires'] = expires_timestamp
-                    
-                    cookies.append(cookie)
-    except FileNotFoundError:
-        logging.error(f"Cookie file {file_path} not found!")
-        return []
-    
-    return cookies
+from Functions.browser_pool import browser_pool
+from Functions.cookies_util import parse_netscape_cookies
+
+# Optional fast path: plain HTTP + C HTML parsing, no Chromium involved
+try:
+    import httpx
+    from selectolax.parser import HTMLParser
+    FAST_PATH_AVAILABLE = True
+except ImportError:
+    FAST_PATH_AVAILABLE = False
+
+# Stealth script, user agents, launch args and headers are constants; built
+# once at import instead of per extraction call
+_STEALTH_INIT_JS = """
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => undefined,
+    });
+
+    Object.defineProperty(navigator, 'plugins', {
+        get: () => [1, 2, 3, 4, 5],
+    });
+
+    Object.defineProperty(navigator, 'languages', {
+        get: () => ['fr-FR', 'fr', 'en'],
+    });
+
+    window.chrome = {
+        runtime: {},
+    };
+"""
+
+# Your realistic user agents for French market
+_USER_AGENTS = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/121.0',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Safari/605.1.15'
+)
+
+# Your exact stealth launch settings
+_LAUNCH_ARGS = (
+    '--disable-blink-features=AutomationControlled',
+    '--disable-dev-shm-usage',
+    '--disable-extensions',
+    '--disable-gpu',
+    '--disable-default-apps',
+    '--disable-translate',
+    '--disable-device-discovery-notifications',
+    '--disable-software-rasterizer',
+    '--disable-background-timer-throttling',
+    '--disable-backgrounding-occluded-windows',
+    '--disable-renderer-backgrounding',
+    '--disable-field-trial-config',
+    '--disable-back-forward-cache',
+    '--disable-ipc-flooding-protection',
+    '--no-first-run',
+    '--no-service-autorun',
+    '--password-store=basic',
+    '--use-mock-keychain'
+)
+
+# Chromium already sends Accept, Accept-Encoding, the Sec-Fetch-* family
+# and Upgrade-Insecure-Requests natively (and in the right order); only
+# override what actually differs from the defaults
+_BASE_HEADERS = {
+    'Accept-Language': 'fr-FR,fr;q=0.9,en;q=0.8',
+    'DNT': '1'
+}
+
+# Resource types that only matter for visual rendering; aborting them cuts
+# most of the page weight while the image URL stays readable from the DOM
+_BLOCKED_RESOURCE_TYPES = {'image', 'media', 'font', 'stylesheet'}
+
+async def _block_heavy_resources(route, request):
+    """Abort image/media/font/css requests; the text doesn't need them"""
+    if request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+# Libération specific unwanted patterns (your exact list), compiled once at
+# import instead of re-parsed on every clean call
+_LIBERATION_PATTERNS = (
+    r'Interview',
+    r'Tribune',
+    r'Mise à jour.*?avec.*?signatures\.',
+    r'data-coreads-cover-banner="true"',
+    r'data-fusion-component=".*?"',
+    r'class=".*?"',
+    r'id=".*?"',
+    r'style=".*?"',
+    r'data-ads-core=".*?"',
+    r'mailmunch-.*?',
+    r'StickyAd-.*?',
+    r'AdLayout-.*?',
+    r'ads-core-placer',
+    r'target="_blank"',
+    r'rel="noreferrer"',
+    r'title="https://.*?"',
+    r'Abonnez-vous',
+    r'S\'abonner',
+    r'Newsletter',
+    r'Suivez Libération',
+    r'Lire aussi'
+)
+
+# All removal patterns fused into one alternation so cleaning is a single
+# pass over the text instead of one full scan per pattern
+_LIBERATION_CLEAN_RE = re.compile('|'.join(f'(?:{p})' for p in _LIBERATION_PATTERNS), re.IGNORECASE | re.DOTALL)
+
+# UI/ad element filter: one case-insensitive scan of the text instead of a
+# lowercase copy plus one substring pass per skip word
+_LIBERATION_SKIP_RE = re.compile(
+    r"abonnez-vous|newsletter|s'abonner|suivez libération|lire aussi"
+    r"|interview|tribune|mise à jour|mailmunch|stickyad|adlayout|ads-core",
+    re.IGNORECASE
+)
 
 def clean_liberation_text(text):
     """Clean Libération article text - your exact approach"""
     if not text:
         return None
-    
-    # Normalize whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
-    
-    # Remove Libération specific unwanted patterns (your exact list)
-    patterns_to_remove = [
-        r'Interview',
-        r'Tribune',
-        r'Mise à jour.*?avec.*?signatures\.',
-        r'data-coreads-cover-banner="true"',
-        r'data-fusion-component=".*?"',
-        r'class=".*?"',
-        r'id=".*?"',
-        r'style=".*?"',
-        r'data-ads-core=".*?"',
-        r'mailmunch-.*?',
-        r'StickyAd-.*?',
-        r'AdLayout-.*?',
-        r'ads-core-placer',
-        r'target="_blank"',
-        r'rel="noreferrer"',
-        r'title="https://.*?"',
-        r'Abonnez-vous',
-        r'S\'abonner',
-        r'Newsletter',
-        r'Suivez Libération',
-        r'Lire aussi'
-    ]
-    
-    for pattern in patterns_to_remove:
-        text = re.sub(pattern, '', text, flags=re.IGNORECASE | re.DOTALL)
-    
+
+    # Too short to survive the final >50 check even before cleanup shrinks
+    # it further - skip the regex pipeline entirely
+    if len(text) < 60:
+        return None
+
+    # Normalize whitespace (str.split collapses any whitespace run in C)
+    text = ' '.join(text.split())
+
+    # Remove Libération specific unwanted patterns in one pass
+    text = _LIBERATION_CLEAN_RE.sub('', text)
+
     # Clean up extra whitespace and common artifacts
-    text = re.sub(r'\s+', ' ', text).strip()
-    text = re.sub(r'<!-- -->', '', text)
-    
+    text = ' '.join(text.split())
+    text = text.replace('<!-- -->', '')
+
     return text if len(text) > 50 else None
 
+# Filtered cookie lists keyed by (path, mtime_ns, domain) — the same file is
+# re-parsed for every article, and mtime invalidates the entry on refresh
+_COOKIE_CACHE = {}
+
 def load_liberation_cookies(cookie_file, domain, news_cookies_dir):
     """Load Libération cookies from file - your exact approach"""
     cookie_path = os.path.join(news_cookies_dir, cookie_file)
-    cookies = parse_netscape_cookies(cookie_path)
-    
-    # Filter cookies for Libération domain
-    domain_cookies = []
-    for cookie in cookies:
-        if domain in cookie.get('domain', '') or cookie.get('domain', '').endswith('.liberation.fr'):
-            domain_cookies.append(cookie)
-    
+
+    try:
+        key = (cookie_path, os.stat(cookie_path).st_mtime_ns, domain)
+    except OSError:
+        key = None
+    if key is not None:
+        cached = _COOKIE_CACHE.get(key)
+        if cached is not None:
+            return list(cached)
+
+    # Domain filtering happens inside the parser, on the first field only,
+    # so unrelated lines never get fully split or built into dicts
+    domain_cookies = parse_netscape_cookies(cookie_path, domain_filter=domain)
+
     logging.info(f"Libération: Loaded {len(domain_cookies)} cookies for {domain}")
-    return domain_cookies
+    if key is not None:
+        _COOKIE_CACHE[key] = domain_cookies
+    return list(domain_cookies)
+
+async def _try_liberation_fast_path(url, cookies):
+    """Try extracting with httpx + selectolax, skipping Playwright entirely.
+
+    Works when the article markup survives server rendering. Returns None
+    when the container or text elements come up empty (JS-rendered page or
+    paywall), in which case the caller falls back to Playwright.
+    """
+    if not FAST_PATH_AVAILABLE:
+        return None
+
+    try:
+        cookie_jar = {c["name"]: c["value"] for c in cookies}
+        headers = {"User-Agent": 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'}
+        async with httpx.AsyncClient(cookies=cookie_jar, follow_redirects=True, timeout=10) as client:
+            response = await client.get(url, headers=headers)
+        if response.status_code != 200:
+            return None
+
+        tree = HTMLParser(response.text)
+
+        container = tree.css_first("article.default__ArticleStyled-sc-1trih19-0, article")
+        if container is None:
+            return None
+
+        title = None
+        title_node = tree.css_first("h1")
+        if title_node:
+            candidate = title_node.text(strip=True)
+            if candidate:
+                title = clean_liberation_text(candidate)
+
+        text_parts = []
+        for node in container.css(".TextElement__Container-sc-koi3k7-0 p, h2, h3"):
+            element_text = node.text().strip()
+            if len(element_text) > 20 and not _LIBERATION_SKIP_RE.search(element_text):
+                clean_text = clean_liberation_text(element_text)
+                if clean_text and len(clean_text) > 30:
+                    text_parts.append(clean_text)
+
+        if not text_parts:
+            return None
+        article_text = ' '.join(text_parts)
+        if len(article_text) <= 100:
+            return None
+
+        image_url = None
+        for node in tree.css("img"):
+            src = node.attributes.get('src')
+            if src and 'liberation.fr' in src:
+                image_url = src
+                break
+
+        logging.info(f"Libération: fast path extracted article ({len(article_text)} chars)")
+        return {
+            "title": title,
+            "article": article_text,
+            "image": image_url,
+            "url": url
+        }
+
+    except Exception as e:
+        logging.info(f"Libération fast path failed, falling back to Playwright: {e}")
+        return None
 
 async def extract_liberation_article_with_playwright(url, news_cookies_dir, cookie_file='www.liberation.fr_cookies.txt'):
     """Extract Libération article using Playwright with your exact stealth approach"""
@@ -115,122 +244,72 @@ async def extract_liberation_article_with_playwright(url, news_cookies_dir, cook
         logging.info(f"Added protocol to URL: {url}")
     
     try:
-        async with async_playwright() as p:
-            # Launch browser with your exact stealth settings
-            browser = await p.chromium.launch(
-                headless=True,  # Production mode
-                args=[
-                    '--disable-blink-features=AutomationControlled',
-                    '--disable-dev-shm-usage',
-                    '--disable-extensions',
-                    '--disable-gpu',
-                    '--disable-default-apps',
-                    '--disable-translate',
-                    '--disable-device-discovery-notifications',
-                    '--disable-software-rasterizer',
-                    '--disable-background-timer-throttling',
-                    '--disable-backgrounding-occluded-windows',
-                    '--disable-renderer-backgrounding',
-                    '--disable-field-trial-config',
-                    '--disable-back-forward-cache',
-                    '--disable-ipc-flooding-protection',
-                    '--no-first-run',
-                    '--no-service-autorun',
-                    '--password-store=basic',
-                    '--use-mock-keychain'
-                ]
-            )
-            
-            # Your realistic user agents for French market
-            user_agents = [
-                'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/121.0',
-                'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Safari/605.1.15'
-            ]
-            
-            selected_ua = random.choice(user_agents)
-            logging.info(f"🎭 Using User Agent: {selected_ua[:50]}...")
-            
-            # Create context with your realistic settings for French market (including Paris geolocation)
-            context = await browser.new_context(
-                user_agent=selected_ua,
-                viewport={'width': 1920, 'height': 1080},
-                device_scale_factor=1,
-                is_mobile=False,
-                has_touch=False,
-                locale='fr-FR',
-                timezone_id='Europe/Paris',
-                permissions=['geolocation'],
-                extra_http_headers={
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
-                    'Accept-Language': 'fr-FR,fr;q=0.9,en;q=0.8',
-                    'Accept-Encoding': 'gzip, deflate, br',
-                    'DNT': '1',
-                    'Connection': 'keep-alive',
-                    'Upgrade-Insecure-Requests': '1',
-                    'Sec-Fetch-Dest': 'document',
-                    'Sec-Fetch-Mode': 'navigate',
-                    'Sec-Fetch-Site': 'none',
-                    'Sec-Fetch-User': '?1',
-                    'Cache-Control': 'max-age=0'
-                },
-                geolocation={'latitude': 48.8566, 'longitude': 2.3522}  # Paris
-            )
-            
-            # Load cookies
-            logging.info("Loading cookies...")
-            cookies = load_liberation_cookies(cookie_file, 'liberation.fr', news_cookies_dir)
-            
-            if cookies:
-                logging.info(f"Adding {len(cookies)} cookies to active session...")
-                successful_cookies = 0
-                failed_cookies = 0
-                
-                for cookie in cookies:
-                    try:
-                        await context.add_cookies([cookie])
-                        successful_cookies += 1
-                        # Log important authentication cookies
-                        if any(key in cookie['name'].lower() for key in ['auth', 'session', 'subscription', 'premium', 'token', 'subscriber']):
-                            logging.info(f"✓ Added AUTH cookie: {cookie['name']}")
-                    except Exception as e:
-                        failed_cookies += 1
-                        logging.warning(f"❌ Failed to add cookie {cookie['name']}: {e}")
-                
-                logging.info(f"Cookie Summary: {successful_cookies} successful, {failed_cookies} failed")
-            
-            page = await context.new_page()
-            
-            # Your additional stealth measures
-            await page.add_init_script("""
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => undefined,
-                });
-                
-                Object.defineProperty(navigator, 'plugins', {
-                    get: () => [1, 2, 3, 4, 5],
-                });
-                
-                Object.defineProperty(navigator, 'languages', {
-                    get: () => ['fr-FR', 'fr', 'en'],
-                });
-                
-                window.chrome = {
-                    runtime: {},
-                };
-            """)
-            
+        # Load cookies
+        logging.info("Loading cookies...")
+        cookies = load_liberation_cookies(cookie_file, 'liberation.fr', news_cookies_dir)
+
+        # Try the cheap HTTP path first; only touch Chromium when it fails
+        fast_result = await _try_liberation_fast_path(url, cookies)
+        if fast_result is not None:
+            return fast_result
+
+        if cookies:
+            # The pool installs the whole jar in one batched add_cookies call
+            # (retrying per cookie only on failure); log the important
+            # authentication cookies here without any per-cookie round-trip
+            logging.info(f"Adding {len(cookies)} cookies to active session...")
+            for cookie in cookies:
+                if any(key in cookie['name'].lower() for key in ['auth', 'session', 'subscription', 'premium', 'token', 'subscriber']):
+                    logging.info(f"✓ AUTH cookie: {cookie['name']}")
+
+        cookie_path = os.path.join(news_cookies_dir, cookie_file)
+        try:
+            cookie_version = os.stat(cookie_path).st_mtime_ns
+        except OSError:
+            cookie_version = 0
+
+        # The UA is picked once per pooled context so the fingerprint stays
+        # stable across requests from the same "device"
+        selected_ua = random.choice(_USER_AGENTS)
+        logging.info(f"🎭 Using User Agent: {selected_ua[:50]}...")
+
+        # Reuse the pooled Chromium: launch args, stealth script and cookies
+        # are applied once per cookie-file version instead of per URL
+        context = await browser_pool.get_context(
+            'liberation',
+            version=cookie_version,
+            launch_args=_LAUNCH_ARGS,
+            cookies=cookies,
+            route=('**/*', _block_heavy_resources),
+            init_script=_STEALTH_INIT_JS,
+            user_agent=selected_ua,
+            viewport={'width': 1920, 'height': 1080},
+            device_scale_factor=1,
+            is_mobile=False,
+            has_touch=False,
+            locale='fr-FR',
+            timezone_id='Europe/Paris',
+            permissions=['geolocation'],
+            extra_http_headers=_BASE_HEADERS,
+            geolocation={'latitude': 48.8566, 'longitude': 2.3522}  # Paris
+        )
+
+        page = await context.new_page()
+        try:
             logging.info(f"🌐 Loading: {url}")
             
             # Navigate with realistic timing
             await page.goto(url, wait_until='domcontentloaded', timeout=30000)
-            await page.wait_for_timeout(3000)
-            
-            # Refresh the page to ensure all elements appear (Libération specific requirement)
-            logging.info("🔄 Refreshing page to load all elements...")
-            await page.reload(wait_until='domcontentloaded')
-            await page.wait_for_timeout(5000)  # Wait longer after refresh
+
+            # Wait on the article container instead of the old fixed
+            # 3s sleep + full reload + 5s sleep (8 wasted seconds per URL)
+            try:
+                await page.wait_for_selector(
+                    "article.default__ArticleStyled-sc-1trih19-0, article",
+                    timeout=10000
+                )
+            except Exception:
+                pass
             
             # Extract title (your exact method)
             title = None
@@ -250,7 +329,7 @@ async def extract_liberation_article_with_playwright(url, news_cookies_dir, cook
                         if title:
                             title = title.strip()
                             # Clean up title
-                            title = re.sub(r'\s+', ' ', title)
+                            title = ' '.join(title.split())
                             title = re.sub(r'&nbsp;', ' ', title)
                             title = clean_liberation_text(title)
                             logging.info(f"✓ Title: {title}")
@@ -303,27 +382,23 @@ async def extract_liberation_article_with_playwright(url, news_cookies_dir, cook
                         continue
                 
                 if article_container:
-                    # Get all text elements within TextElement containers
-                    text_elements = await article_container.locator(".TextElement__Container-sc-koi3k7-0 p, h2, h3").all()
-                    
-                    if text_elements:
+                    # Get all text elements within TextElement containers;
+                    # evaluate_all returns every text in one CDP round-trip
+                    # instead of one text_content call per element
+                    texts = await article_container.locator(
+                        ".TextElement__Container-sc-koi3k7-0 p, h2, h3"
+                    ).evaluate_all("els => els.map(e => e.textContent || '')")
+
+                    if texts:
                         text_parts = []
-                        for element in text_elements:
-                            try:
-                                element_text = await element.text_content()
-                                if element_text and len(element_text.strip()) > 20:
-                                    # Skip Libération UI elements and ads
-                                    if not any(skip_word in element_text.lower() for skip_word in [
-                                        'abonnez-vous', 'newsletter', 's\'abonner', 'suivez libération',
-                                        'lire aussi', 'interview', 'tribune', 'mise à jour',
-                                        'mailmunch', 'stickyad', 'adlayout', 'ads-core'
-                                    ]):
-                                        clean_text = clean_liberation_text(element_text.strip())
-                                        if clean_text and len(clean_text) > 30:
-                                            text_parts.append(clean_text)
-                            except:
-                                continue
-                        
+                        for element_text in texts:
+                            if element_text and len(element_text.strip()) > 20:
+                                # Skip Libération UI elements and ads
+                                if not _LIBERATION_SKIP_RE.search(element_text):
+                                    clean_text = clean_liberation_text(element_text.strip())
+                                    if clean_text and len(clean_text) > 30:
+                                        text_parts.append(clean_text)
+
                         if text_parts:
                             article_text = ' '.join(text_parts)
                             logging.info(f"✓ Extracted {len(text_parts)} text elements ({len(article_text)} chars)")
@@ -332,20 +407,19 @@ async def extract_liberation_article_with_playwright(url, news_cookies_dir, cook
                     else:
                         logging.error("❌ No text elements found - trying fallback")
                         
-                        # Fallback: extract all paragraphs with text-element class
-                        all_paragraphs = await article_container.locator("p.text-element").all()
-                        if all_paragraphs:
+                        # Fallback: extract all paragraphs with text-element
+                        # class, again as one batched evaluate_all call
+                        fallback_texts = await article_container.locator(
+                            "p.text-element"
+                        ).evaluate_all("els => els.map(e => e.textContent || '')")
+                        if fallback_texts:
                             text_parts = []
-                            for p in all_paragraphs:
-                                try:
-                                    p_text = await p.text_content()
-                                    if p_text and len(p_text.strip()) > 30:
-                                        clean_text = clean_liberation_text(p_text.strip())
-                                        if clean_text and len(clean_text) > 30:
-                                            text_parts.append(clean_text)
-                                except:
-                                    continue
-                            
+                            for p_text in fallback_texts:
+                                if p_text and len(p_text.strip()) > 30:
+                                    clean_text = clean_liberation_text(p_text.strip())
+                                    if clean_text and len(clean_text) > 30:
+                                        text_parts.append(clean_text)
+
                             if text_parts:
                                 article_text = ' '.join(text_parts)
                                 logging.info(f"✓ Fallback extracted {len(text_parts)} paragraphs ({len(article_text)} chars)")
@@ -359,19 +433,20 @@ async def extract_liberation_article_with_playwright(url, news_cookies_dir, cook
             except Exception as e:
                 logging.error(f"❌ Article extraction error: {e}")
             
-            await browser.close()
-            
-            if article_text and len(article_text) > 100:
-                return {
-                    "title": title,
-                    "article": article_text,
-                    "image": image_url,
-                    "url": url
-                }
-            else:
-                logging.error(f"Libération: Article text too short or empty - possible paywall issue")
-                return None
-                
+        finally:
+            await page.close()
+
+        if article_text and len(article_text) > 100:
+            return {
+                "title": title,
+                "article": article_text,
+                "image": image_url,
+                "url": url
+            }
+        else:
+            logging.error(f"Libération: Article text too short or empty - possible paywall issue")
+            return None
+
     except Exception as e:
         logging.error(f"Libération Playwright extraction failed: {e}")
         return None
@@ -379,4 +454,18 @@ async def extract_liberation_article_with_playwright(url, news_cookies_dir, cook
 async def extract_liberation_article(url, news_cookies_dir):
     """Main Libération extraction function"""
     result = await extract_liberation_article_with_playwright(url, news_cookies_dir)
-    return result 
\ No newline at end of file
+    return result
+
+async def extract_liberation_batch(urls, news_cookies_dir, concurrency=4):
+    """Extract several Libération articles concurrently against the pooled browser.
+
+    Parallelism is capped so Chromium isn't starved of tabs; failures come
+    back as exception objects in the result list (input order preserved).
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _extract_one(url):
+        async with semaphore:
+            return await extract_liberation_article(url, news_cookies_dir)
+
+    return await asyncio.gather(*(_extract_one(url) for url in urls), return_exceptions=True)
@@ -0,0 +1,55 @@
+"""Non-blocking logging setup shared by the downloader modules.
+
+Importing this module configures the root logger once: records go into an
+in-process queue and a background listener thread does the file and console
+writes, so hot download loops never block on log I/O. basicConfig only ever
+applied the first module's handlers anyway, so the downloaders share one
+rotating log file here.
+"""
+
+import atexit
+import logging
+import os
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+_LOG_FILE = "./logs/video_downloader.log"
+
+_configured = False
+
+
+def _configure():
+    global _configured
+    if _configured:
+        return
+    _configured = True
+
+    os.makedirs(os.path.dirname(_LOG_FILE), exist_ok=True)
+
+    log_queue = queue.Queue(-1)
+    root = logging.getLogger()
+    # Replace any handlers a module-level basicConfig installed before this
+    # import ran - leaving them stacked would write every record twice,
+    # once synchronously through the old handlers and once via the queue
+    for stale in root.handlers[:]:
+        root.removeHandler(stale)
+        stale.close()
+    root.setLevel(logging.INFO)
+    root.addHandler(QueueHandler(log_queue))
+
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    # delay=True keeps the file closed until the first record arrives
+    file_handler = RotatingFileHandler(
+        _LOG_FILE, maxBytes=10 * 1024 * 1024, backupCount=3,
+        encoding='utf-8', delay=True
+    )
+    stream_handler = logging.StreamHandler()
+    for handler in (file_handler, stream_handler):
+        handler.setFormatter(formatter)
+
+    listener = QueueListener(log_queue, file_handler, stream_handler)
+    listener.start()
+    atexit.register(listener.stop)
+
+
+_configure()
@@ -2,8 +2,32 @@ import asyncio
 import os
 import re
 import logging
+from functools import lru_cache
 from urllib.parse import urlparse, urljoin
-from playwright.async_api import async_playwright
+from Functions.browser_pool import browser_pool
+
+# Prefixes https:// onto scheme-less URLs and repairs the ':/...' form in
+# one pass (the negative lookahead matches zero-width, so valid URLs are
+# untouched)
+_URL_FIXUP_RE = re.compile(r'^(?::/+|(?!https?://))')
+
+# Batch retries re-pass identical URLs; cache the parse
+_parse_url = lru_cache(maxsize=1024)(urlparse)
+
+MEDIAPART_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+_LAUNCH_ARGS = ('--disable-blink-features=AutomationControlled',)
+
+# Resource types that only matter for visual rendering; aborting them cuts
+# most of the page weight while the image src stays readable from the DOM
+_BLOCKED_RESOURCE_TYPES = {'image', 'media', 'font', 'stylesheet'}
+
+async def _block_heavy_resources(route, request):
+    """Abort image/media/font/css requests; the text doesn't need them"""
+    if request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
 
 # Mediapart configuration
 MEDIAPART_CONFIG = {
@@ -15,45 +39,83 @@ MEDIAPART_CONFIG = {
     'wait_for_selector': 'h1#page-title'
 }
 
+# Mediapart specific unwanted patterns (your exact list), fused into one
+# alternation so cleanup scans each paragraph once instead of per pattern
+_MEDIAPART_PATTERNS = (
+    r'Lire \+ tard',
+    r'Offrir l\'article',
+    r'Grossir le texte',
+    r'Réduire le texte',
+    r'Imprimer',
+    r'À lire aussi',
+    r'Agrandir l\'image',
+    r'Fermer',
+    r'Recommander',
+    r'\d+ commentaires?',
+    r'©.*',
+    r'Illustration \d+',
+    r'Screen reader only',
+    r'aria-hidden="true"',
+    r'data-.*?=".*?"',
+    r'class=".*?"',
+    r'id=".*?"'
+)
+
+_MEDIAPART_CLEAN_RE = re.compile(
+    '|'.join(f'(?:{p})' for p in _MEDIAPART_PATTERNS),
+    re.IGNORECASE
+)
+
+_WS_RE = re.compile(r'\s+')
+
+# Runs inside the page so title, image and every paragraph come back in a
+# single CDP message rather than one round-trip per element
+_MEDIAPART_HARVEST_JS = """
+() => {
+    const title = document.querySelector('h1#page-title');
+    const image = document.querySelector('.news__body__center img[src]');
+    const paragraphs = Array.from(
+        document.querySelectorAll('.news__body__center__article p, .news__body__center__article h2[data-mediapart-role="subheading"]')
+    ).map(e => e.textContent.trim()).filter(t => t.length > 20);
+    return {
+        title: title ? title.textContent : null,
+        image: image ? image.getAttribute('src') : null,
+        paragraphs: paragraphs
+    };
+}
+"""
+
 def clean_mediapart_text(text):
     """Clean Mediapart article text - your exact approach"""
     if not text:
         return None
-    
+
     # Normalize whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
-    
-    # Remove Mediapart specific unwanted patterns (your exact list)
-    patterns_to_remove = [
-        r'Lire \+ tard',
-        r'Offrir l\'article',
-        r'Grossir le texte',
-        r'Réduire le texte',
-        r'Imprimer',
-        r'À lire aussi',
-        r'Agrandir l\'image',
-        r'Fermer',
-        r'Recommander',
-        r'\d+ commentaires?',
-        r'©.*',
-        r'Illustration \d+',
-        r'Screen reader only',
-        r'aria-hidden="true"',
-        r'data-.*?=".*?"',
-        r'class=".*?"',
-        r'id=".*?"'
-    ]
-    
-    for pattern in patterns_to_remove:
-        text = re.sub(pattern, '', text, flags=re.IGNORECASE)
-    
+    text = _WS_RE.sub(' ', text).strip()
+
+    text = _MEDIAPART_CLEAN_RE.sub('', text)
+
     # Clean up extra whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
-    
+    text = _WS_RE.sub(' ', text).strip()
+
     return text if len(text) > 50 else None
 
+# Parsed cookie lists keyed by (path, mtime_ns) — the same file is reloaded
+# for every article, and mtime invalidates the entry on refresh
+_COOKIE_CACHE = {}
+
 def load_mediapart_cookies(cookie_file, domain):
     """Load cookies from Netscape format file - EXACT USER METHOD"""
+    try:
+        key = (cookie_file, os.stat(cookie_file).st_mtime_ns)
+    except OSError:
+        logging.error(f"Cookie file {cookie_file} not found!")
+        return []
+
+    cached = _COOKIE_CACHE.get(key)
+    if cached is not None:
+        return list(cached)
+
     cookies = []
     try:
         with open(cookie_file, 'r') as f:
@@ -88,18 +150,17 @@ def load_mediapart_cookies(cookie_file, domain):
         return []
     
     logging.info(f"Loaded {len(cookies)} cookies for Mediapart")
-    return cookies
+    _COOKIE_CACHE[key] = cookies
+    return list(cookies)
 
 async def extract_mediapart_article(url, news_cookies_dir):
     """Extract article content using Playwright for Mediapart"""
     # Fix malformed URLs missing protocol (same as in main.py)
-    if url.startswith(':/'):
-        url = 'https' + url
-    elif not url.startswith(('http://', 'https://')):
-        url = 'https://' + url
-    
-    domain = urlparse(url).hostname
-    if not domain or 'mediapart.fr' not in domain:
+    url = _URL_FIXUP_RE.sub('https://', url, count=1)
+
+    domain = _parse_url(url).hostname
+    # Suffix check, not substring: 'mediapart.fr.evil.com' must not pass
+    if not domain or not (domain == 'mediapart.fr' or domain.endswith('.mediapart.fr')):
         raise ValueError("Invalid Mediapart URL")
     
     # Find cookie file for Mediapart
@@ -108,109 +169,93 @@ async def extract_mediapart_article(url, news_cookies_dir):
         cookie_file = os.path.join(news_cookies_dir, f"{domain}_cookies.txt")
     
     cookies = load_mediapart_cookies(cookie_file, domain)
-    
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(
-            headless=True,
-            args=['--disable-blink-features=AutomationControlled']
-        )
-        
-        context = await browser.new_context(
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        )
-        
+
+    try:
+        cookie_version = os.stat(cookie_file).st_mtime_ns
+    except OSError:
+        cookie_version = 0
+
+    # Shared browser/context from the pool - Chromium stays warm across
+    # articles, and the pool batch-installs the cookie jar before any
+    # navigation so the warm-up homepage load is no longer needed
+    context = await browser_pool.get_context(
+        'mediapart',
+        version=cookie_version,
+        launch_args=_LAUNCH_ARGS,
+        cookies=cookies,
+        route=('**/*', _block_heavy_resources),
+        user_agent=MEDIAPART_USER_AGENT
+    )
+
+    page = await context.new_page()
+    try:
+        # Navigate DIRECTLY to target article (your exact approach)
+        logging.info(f"Navigating to article: {url}")
+        await page.goto(url, wait_until='domcontentloaded', timeout=15000)
+
+        # Wait for actual article paragraphs rather than sleeping a fixed 3s;
+        # this returns as soon as the body is in the DOM
+        await page.wait_for_selector('.news__body__center__article p', timeout=10000)
+
+        # One evaluate harvests title, image and paragraph texts together
+        # instead of a CDP round-trip per element
+        title = None
+        article_text = None
+        image_url = None
         try:
-            page = await context.new_page()
-            
-            # STEP 1: Navigate to main site FIRST (like your Selenium script)
-            logging.info("Opening Mediapart main site to establish session...")
-            await page.goto('https://www.mediapart.fr', wait_until='domcontentloaded', timeout=15000)
-            await page.wait_for_timeout(2000)  # Wait for initial page load
-            
-            # STEP 2: Add cookies to active session (like your script)
-            if cookies:
-                logging.info(f"Adding {len(cookies)} cookies to active session...")
-                for cookie in cookies:
-                    try:
-                        await context.add_cookies([cookie])
-                        logging.info(f"Added cookie: {cookie['name']}")
-                    except Exception as e:
-                        logging.warning(f"Failed to add cookie {cookie['name']}: {e}")
-            
-            # STEP 3: Navigate DIRECTLY to target article (your exact approach)
-            logging.info(f"Navigating to article: {url}")
-            await page.goto(url, wait_until='domcontentloaded', timeout=15000)
-            
-            # Wait for page to load (like your WebDriverWait)
-            await page.wait_for_selector("h1", timeout=10000)
-            await page.wait_for_timeout(3000)  # Additional wait like your time.sleep(3)
-            
-            # Extract title (your exact method)
-            title = None
-            try:
-                title_element = await page.query_selector("h1#page-title")
-                if title_element:
-                    title = (await title_element.text_content()).strip()
-                    logging.info(f"✓ Title: {title}")
-            except Exception as e:
-                logging.error(f"❌ Title extraction error: {e}")
-            
-            # Extract article body (your exact method)
-            article_text = None
-            try:
-                # Get the main article container (your approach)
-                article_container = await page.query_selector(".news__body__center__article")
-                
-                if article_container:
-                    # Get all paragraphs (your approach)
-                    paragraph_elements = await article_container.query_selector_all("p")
-                    
-                    if paragraph_elements:
-                        text_parts = []
-                        for p in paragraph_elements:
-                            paragraph_text = (await p.text_content()).strip()
-                            if paragraph_text and len(paragraph_text) > 20:
-                                clean_paragraph = clean_mediapart_text(paragraph_text)
-                                if clean_paragraph:
-                                    text_parts.append(clean_paragraph)
-                        
-                        if text_parts:
-                            article_text = ' '.join(text_parts)
-                            logging.info(f"✓ Extracted {len(text_parts)} paragraphs ({len(article_text)} chars)")
-                        else:
-                            logging.error("❌ No valid paragraphs found")
-                    else:
-                        logging.error("❌ No paragraph elements found")
-                else:
-                    logging.error("❌ Article container not found")
-                    
-            except Exception as e:
-                logging.error(f"❌ Article extraction error: {e}")
-            
-            # Extract first image (your exact method)
-            image_url = None
-            try:
-                # Look for images in the article body (your approach)
-                img_element = await page.query_selector(".news__body__center img[src]")
-                if img_element:
-                    image_url = await img_element.get_attribute('src')
-                    logging.info(f"✓ Image: {image_url}")
-            except Exception as e:
-                logging.error(f"❌ Image extraction error: {e}")
-            
-            await browser.close()
-            
-            if not article_text:
-                raise ValueError("No Mediapart article content extracted")
-            
-            return {
-                "title": title or "Unknown Title",
-                "article": article_text,
-                "image": image_url,
-                "url": url,
-                "domain": domain
-            }
-            
+            harvest = await page.evaluate(_MEDIAPART_HARVEST_JS)
+
+            title = (harvest.get('title') or '').strip() or None
+            if title:
+                logging.info(f"✓ Title: {title}")
+
+            image_url = harvest.get('image')
+            if image_url:
+                logging.info(f"✓ Image: {image_url}")
+
+            # Generator feed into join - no second copy of the cleaned
+            # paragraphs held alongside the final string
+            article_text = ' '.join(
+                clean_paragraph
+                for paragraph_text in harvest.get('paragraphs') or []
+                if (clean_paragraph := clean_mediapart_text(paragraph_text))
+            ) or None
+
+            if article_text:
+                logging.info(f"✓ Extracted article text ({len(article_text)} chars)")
+            else:
+                logging.error("❌ No valid paragraphs found")
+
         except Exception as e:
-            await browser.close()
-            raise Exception(f"Mediapart Playwright extraction failed: {str(e)}") 
\ No newline at end of file
+            logging.error(f"❌ Article extraction error: {e}")
+
+        if not article_text:
+            raise ValueError("No Mediapart article content extracted")
+
+        return {
+            "title": title or "Unknown Title",
+            "article": article_text,
+            "image": image_url,
+            "url": url,
+            "domain": domain
+        }
+
+    except Exception as e:
+        raise Exception(f"Mediapart Playwright extraction failed: {str(e)}")
+    finally:
+        # Page is per-article; the pooled context and browser stay warm
+        await page.close()
+
+async def extract_mediapart_articles(urls, news_cookies_dir, concurrency=8):
+    """Extract several Mediapart articles concurrently against the pooled browser.
+
+    Parallelism is capped so Chromium isn't starved of tabs; failures come
+    back as exception objects in the result list (input order preserved).
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _extract_one(url):
+        async with semaphore:
+            return await extract_mediapart_article(url, news_cookies_dir)
+
+    return await asyncio.gather(*(_extract_one(url) for url in urls), return_exceptions=True)
\ No newline at end of file
@@ -0,0 +1,299 @@
+import http.cookiejar
+import os
+import re
+import logging
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from urllib.parse import urlparse, urljoin
+from playwright.async_api import async_playwright
+
+# Optional fast path: plain HTTP + C HTML parsing, no Chromium involved
+try:
+    import httpx
+    from selectolax.parser import HTMLParser
+    FAST_PATH_AVAILABLE = True
+except ImportError:
+    FAST_PATH_AVAILABLE = False
+
+_HTTP_PREFIXES = ('http://', 'https://')
+
+
+def _normalize_url(url):
+    """Fix malformed URLs missing protocol"""
+    if url.startswith(_HTTP_PREFIXES):
+        return url
+    if url.startswith(':/'):
+        return 'https' + url
+    return 'https://' + url
+
+
+# Shared browser fingerprint for all config-driven news sites
+NEWS_USER_AGENT ='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+
+@dataclass(frozen=True, slots=True)
+class NewsSiteConfig:
+    """Selectors and cleaning hooks for one supported news site"""
+    name: str                # display name used in log messages, e.g. "Le Figaro"
+    domain_match: str        # registrable domain, e.g. "lefigaro.fr"
+    title_selector: str
+    paragraphs_selector: str
+    image_selector: str
+    wait_for_selector: str
+    clean_text: object       # callable(text) -> cleaned text or None
+    title_from_html: bool = False   # strip tags from inner_html instead of text_content
+    default_title: str = None
+
+
+@dataclass(frozen=True, slots=True)
+class ArticleResult:
+    """Extracted article payload, pre-laid-out instead of a per-call dict"""
+    title: str
+    article: str
+    image: str
+    url: str
+    domain: str
+
+    def as_dict(self):
+        """Plain dict for JSON serialization / callers that mutate the result"""
+        return asdict(self)
+
+
+def load_news_cookies(cookie_file, domain, site_name):
+    """Load cookies from Netscape format file for a news site"""
+    if not os.path.exists(cookie_file):
+        logging.warning(f"{site_name} cookie file not found: {cookie_file}")
+        return []
+
+    try:
+        jar = http.cookiejar.MozillaCookieJar()
+        jar.load(cookie_file, ignore_discard=True, ignore_expires=True)
+
+        # Match cookies on the registrable domain suffix (e.g. lefigaro.fr)
+        # instead of substring search, which would also match unrelated hosts
+        reg_domain = ".".join(domain.split(".")[-2:])
+        dot_suffix = "." + reg_domain
+        cookies = [
+            {
+                "name": cookie.name,
+                "value": cookie.value,
+                "domain": cookie.domain,
+                "path": cookie.path,
+                "expires": cookie.expires if cookie.expires else -1,
+                "httpOnly": bool(cookie._rest.get("HttpOnly", False)),
+                "secure": cookie.secure,
+                "sameSite": "Lax"
+            }
+            for cookie in jar
+            if cookie.domain.lstrip(".") == reg_domain or cookie.domain.endswith(dot_suffix)
+        ]
+
+        logging.info(f"Loaded {len(cookies)} cookies for {site_name} ({domain})")
+        return cookies
+
+    except Exception as e:
+        logging.error(f"Error loading {site_name} cookies from {cookie_file}: {e}")
+        return []
+
+
+async def _try_httpx_fast_path(url, domain, cookies, config):
+    """Try extracting with httpx + selectolax, skipping Playwright entirely.
+
+    Works for server-rendered, non-paywalled pages. Returns None when the
+    selectors come up empty (JS-rendered page or paywall), in which case the
+    caller falls back to the full Playwright extraction.
+    """
+    if not FAST_PATH_AVAILABLE:
+        return None
+
+    try:
+        cookie_jar = {c["name"]: c["value"] for c in cookies}
+        async with httpx.AsyncClient(cookies=cookie_jar, follow_redirects=True, timeout=10) as client:
+            response = await client.get(url, headers={"User-Agent": NEWS_USER_AGENT})
+        if response.status_code != 200:
+            return None
+
+        tree = HTMLParser(response.text)
+
+        title_node = tree.css_first(config.title_selector)
+        title = title_node.text(strip=True) if title_node else None
+
+        cleaned = (config.clean_text(text.strip())
+                   for text in (node.text() for node in tree.css(config.paragraphs_selector))
+                   if text and len(text.strip()) > 30)
+        article_text = ' '.join(p for p in cleaned if p)
+
+        if not title or not article_text:
+            return None
+
+        image_url = None
+        image_node = tree.css_first(config.image_selector)
+        if image_node:
+            image_url = image_node.attributes.get('src')
+            if not image_url:
+                srcset = image_node.attributes.get('srcset')
+                if srcset:
+                    image_url = srcset.split(',')[0].strip().split(' ')[0]
+            if image_url and not image_url.startswith('http'):
+                image_url = urljoin(url, image_url)
+
+        logging.info(f"{config.name}: fast path extracted article ({len(article_text)} chars)")
+        return ArticleResult(
+            title=title,
+            article=article_text,
+            image=image_url,
+            url=url,
+            domain=domain
+        )
+
+    except Exception as e:
+        logging.info(f"{config.name} fast path failed, falling back to Playwright: {e}")
+        return None
+
+
+# Memoized extraction results keyed by (url, cookie file mtime); re-runs and
+# retries of the same URL skip the whole fetch as long as cookies are unchanged
+_EXTRACT_CACHE = OrderedDict()
+_EXTRACT_CACHE_MAX = 256
+
+
+def clear_extract_cache():
+    """Drop memoized extraction results to force fresh fetches"""
+    _EXTRACT_CACHE.clear()
+
+
+async def extract_article(url, config, news_cookies_dir):
+    """Extract article content using Playwright, driven by a NewsSiteConfig"""
+    url = _normalize_url(url)
+
+    domain = urlparse(url).hostname
+    # Suffix check, not substring: "lefigaro.fr" in "fakelefigaro.fr" is True
+    if not domain or not domain.endswith(config.domain_match):
+        raise ValueError(f"Invalid {config.name} URL")
+
+    # Find cookie file for the site
+    cookie_file = os.path.join(news_cookies_dir, f"www.{domain}_cookies.txt")
+    if not os.path.exists(cookie_file):
+        cookie_file = os.path.join(news_cookies_dir, f"{domain}_cookies.txt")
+
+    cache_key = (url, os.path.getmtime(cookie_file) if os.path.exists(cookie_file) else 0)
+    cached = _EXTRACT_CACHE.get(cache_key)
+    if cached is not None:
+        _EXTRACT_CACHE.move_to_end(cache_key)
+        logging.info(f"{config.name}: returning cached result for {url}")
+        return cached
+
+    result = await _extract_article_impl(url, domain, cookie_file, config)
+
+    _EXTRACT_CACHE[cache_key] = result
+    if len(_EXTRACT_CACHE) > _EXTRACT_CACHE_MAX:
+        _EXTRACT_CACHE.popitem(last=False)
+    return result
+
+
+async def _extract_article_impl(url, domain, cookie_file, config):
+    """Run the actual fast-path / Playwright extraction for one URL"""
+    cookies = load_news_cookies(cookie_file, domain, config.name)
+    if not cookies:
+        logging.warning(f"No cookies loaded for {config.name} ({domain})")
+
+    # Try the cheap HTTP path first; only launch Chromium when it fails
+    fast_result = await _try_httpx_fast_path(url, domain, cookies, config)
+    if fast_result is not None:
+        return fast_result
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(
+            headless=True,
+            args=['--disable-blink-features=AutomationControlled']
+        )
+
+        context = await browser.new_context(user_agent=NEWS_USER_AGENT)
+
+        try:
+            if cookies:
+                await context.add_cookies(cookies)
+
+            page = await context.new_page()
+
+            logging.info(f"Loading {config.name} URL: {url}")
+            await page.goto(url, wait_until='networkidle', timeout=30000)
+
+            # Wait for content to load
+            await page.wait_for_selector(config.wait_for_selector, timeout=10000)
+
+            # Extract title
+            title = None
+            try:
+                title_element = await page.query_selector(config.title_selector)
+                if title_element:
+                    if config.title_from_html:
+                        title_html = await title_element.inner_html()
+                        # Remove HTML tags but keep text
+                        title = re.sub(r'<[^>]+>', '', title_html).strip()
+                        # Clean up HTML entities
+                        title = title.replace('&nbsp;', ' ').replace('&amp;', '&')
+                    else:
+                        title = (await title_element.text_content()).strip()
+                    logging.info(f"{config.name} title extracted: {title}")
+            except Exception as e:
+                logging.error(f"{config.name} title extraction error: {e}")
+
+            # Extract article paragraphs
+            article_text = None
+            try:
+                paragraph_elements = await page.query_selector_all(config.paragraphs_selector)
+
+                if paragraph_elements:
+                    texts = [await element.text_content() for element in paragraph_elements]
+                    # Single pass: filter, clean and join without an intermediate list
+                    cleaned = (config.clean_text(text.strip())
+                               for text in texts
+                               if text and len(text.strip()) > 30)  # Only substantial paragraphs
+                    article_text = ' '.join(p for p in cleaned if p) or None
+
+                    if article_text:
+                        logging.info(f"{config.name}: Extracted article ({len(article_text)} chars)")
+                    else:
+                        logging.warning(f"{config.name}: No valid paragraphs found")
+                else:
+                    logging.warning(f"{config.name}: No paragraph elements found")
+
+            except Exception as e:
+                logging.error(f"{config.name} article extraction error: {e}")
+
+            # Extract first image
+            image_url = None
+            try:
+                image_element = await page.query_selector(config.image_selector)
+                if image_element:
+                    image_url = await image_element.get_attribute('src')
+                    # Handle srcset if src is not available
+                    if not image_url:
+                        srcset = await image_element.get_attribute('srcset')
+                        if srcset:
+                            # Get first URL from srcset
+                            image_url = srcset.split(',')[0].strip().split(' ')[0]
+                    # Handle relative URLs
+                    if image_url and not image_url.startswith('http'):
+                        image_url = urljoin(url, image_url)
+                    logging.info(f"{config.name} image extracted: {image_url}")
+            except Exception as e:
+                logging.error(f"{config.name} image extraction error: {e}")
+
+            await browser.close()
+
+            if not article_text:
+                raise ValueError(f"No {config.name} article content extracted")
+
+            return ArticleResult(
+                title=title or config.default_title,
+                article=article_text,
+                image=image_url,
+                url=url,
+                domain=domain
+            )
+
+        except Exception as e:
+            await browser.close()
+            raise Exception(f"{config.name} Playwright extraction failed: {str(e)}")
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import re
 import os
@@ -5,124 +6,250 @@ import random
 import time
 import uuid
 import json
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
+from Functions.browser_pool import browser_pool
+from Functions.cookies_util import parse_netscape_cookies
+
+# Realistic user agents for NYT (US market) - your exact list, shared by
+# the Playwright and Selenium paths
+_NYT_USER_AGENTS = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36 Edg/119.0.0.0'
+)
+
+# Registered once per context via add_init_script so it runs before any
+# document script - unlike the Selenium execute_script block, which fired
+# only after the page had already started loading
+_NYT_STEALTH_JS = """
+Object.defineProperty(navigator, 'webdriver', {
+    get: () => undefined,
+});
+Object.defineProperty(navigator, 'plugins', {
+    get: () => [1, 2, 3, 4, 5],
+});
+Object.defineProperty(navigator, 'languages', {
+    get: () => ['en-US', 'en'],
+});
+window.chrome = { runtime: {} };
+Object.defineProperty(navigator, 'maxTouchPoints', {
+    get: () => 1,
+});
+"""
+
+_NYT_LAUNCH_ARGS = (
+    '--disable-blink-features=AutomationControlled',
+    '--disable-extensions',
+    '--disable-gpu',
+    '--no-first-run',
+    '--window-size=1920,1080'
+)
 
 def get_domain_from_url(url):
     """Extract domain from URL"""
     parsed = urlparse(url)
     return parsed.hostname
 
+# Resolved once per process - ChromeDriverManager().install() does version
+# checks (and possibly network calls) on every invocation otherwise
+_CHROMEDRIVER_PATH = None
+
+def _get_chromedriver_service():
+    """Return a Service for the cached chromedriver path, resolving it once"""
+    global _CHROMEDRIVER_PATH
+    if _CHROMEDRIVER_PATH is None:
+        _CHROMEDRIVER_PATH = ChromeDriverManager().install()
+    return Service(_CHROMEDRIVER_PATH)
+
+# Parsed cookie lists keyed by (parser, path, mtime_ns) — the same file is
+# reloaded for every article, and mtime invalidates the entry on refresh
+_COOKIE_CACHE = {}
+
+def _parse_cookie_file(cookie_file_path):
+    """Parse the JSON/Netscape cookie file into CDP cookie dicts, cached by mtime"""
+    key = ('cdp', cookie_file_path, os.stat(cookie_file_path).st_mtime_ns)
+    cached = _COOKIE_CACHE.get(key)
+    if cached is not None:
+        return list(cached)
+
+    cookies = []
+    with open(cookie_file_path, 'r', encoding='utf-8') as f:
+        # Sniff the first byte instead of slurping the whole file twice
+        is_json = f.read(1) == '['
+        f.seek(0)
+
+        if is_json:
+            raw_cookies = json.load(f)
+            logging.info(f"Detected JSON cookie format with {len(raw_cookies)} cookies")
+            for cookie in raw_cookies:
+                # Convert JSON cookie format to CDP format
+                cookie_dict = {
+                    'domain': cookie.get('domain'),
+                    'httpOnly': cookie.get('httpOnly', False),
+                    'name': cookie.get('name'),
+                    'path': cookie.get('path', '/'),
+                    'secure': cookie.get('secure', False),
+                    'value': cookie.get('value')
+                }
+
+                # Add expiry if it exists (convert to int if needed)
+                if 'expirationDate' in cookie:
+                    cookie_dict['expires'] = int(cookie['expirationDate'])
+                elif 'expiry' in cookie:
+                    cookie_dict['expires'] = int(cookie['expiry'])
+
+                cookies.append(cookie_dict)
+        else:
+            # Assume it's Netscape format, streamed line by line
+            logging.info("Attempting to parse as Netscape cookie format")
+            for line in f:
+                if line.startswith('#') or line.strip() == '':
+                    continue  # Skip comments and blank lines
+
+                parts = line.strip().split('\t')
+                if len(parts) == 7:
+                    cookie = {
+                        'domain': parts[0],
+                        'httpOnly': parts[1] == 'TRUE',
+                        'path': parts[2],
+                        'secure': parts[3] == 'TRUE',
+                        'name': parts[5],
+                        'value': parts[6]
+                    }
+                    if parts[4].isdigit():
+                        cookie['expires'] = int(parts[4])
+                    cookies.append(cookie)
+
+    _COOKIE_CACHE[key] = cookies
+    return list(cookies)
+
 # Function to add cookies from either JSON or Netscape cookie file - your proven Instagram method
 def add_cookies_from_file(driver, cookie_file_path):
     try:
-        with open(cookie_file_path, 'r', encoding='utf-8') as f:
-            content = f.read().strip()
-            
-            # Try to detect if it's JSON format
-            if content.startswith('[') and content.endswith(']'):
-                # JSON format
-                try:
-                    cookies = json.loads(content)
-                    logging.info(f"Detected JSON cookie format with {len(cookies)} cookies")
-                    for cookie in cookies:
-                        # Convert JSON cookie format to Selenium format
-                        cookie_dict = {
-                            'domain': cookie.get('domain'),
-                            'httpOnly': cookie.get('httpOnly', False),
-                            'name': cookie.get('name'),
-                            'path': cookie.get('path', '/'),
-                            'secure': cookie.get('secure', False),
-                            'value': cookie.get('value')
-                        }
-                        
-                        # Add expiry if it exists (convert to int if needed)
-                        if 'expirationDate' in cookie:
-                            cookie_dict['expiry'] = int(cookie['expirationDate'])
-                        elif 'expiry' in cookie:
-                            cookie_dict['expiry'] = int(cookie['expiry'])
-                            
-                        driver.add_cookie(cookie_dict)
-                    logging.info("JSON cookies added successfully.")
-                except json.JSONDecodeError as e:
-                    logging.error(f"Error parsing JSON cookies: {e}")
-                    return False
-            else:
-                # Assume it's Netscape format
-                logging.info("Attempting to parse as Netscape cookie format")
-                lines = content.splitlines()
-                cookie_count = 0
-                
-                for line in lines:
-                    if line.startswith('#') or line.strip() == '':
-                        continue  # Skip comments and blank lines
-                    
-                    parts = line.strip().split('\t')
-                    if len(parts) == 7:
-                        cookie = {
-                            'domain': parts[0],
-                            'httpOnly': parts[1] == 'TRUE',
-                            'path': parts[2],
-                            'secure': parts[3] == 'TRUE',
-                            'expiry': int(parts[4]) if parts[4].isdigit() else None,
-                            'name': parts[5],
-                            'value': parts[6]
-                        }
-                        driver.add_cookie(cookie)
-                        cookie_count += 1
-                
-                logging.info(f"Netscape cookies: Added {cookie_count} cookies successfully.")
-                
-                if cookie_count == 0:
-                    logging.warning("No valid cookies found in the Netscape format file.")
-                    return False
-        
+        cookies = _parse_cookie_file(cookie_file_path)
+        if not cookies:
+            logging.warning(f"No valid cookies found in {cookie_file_path}")
+            return False
+
+        # One CDP call installs the whole jar instead of a WebDriver
+        # round-trip per cookie
+        driver.execute_cdp_cmd("Network.setCookies", {"cookies": cookies})
+        logging.info(f"Added {len(cookies)} cookies in one batch.")
         return True
     except Exception as e:
         logging.error(f"Error loading cookies: {e}")
         return False
 
+# NYT specific unwanted patterns, fused into one alternation so cleanup
+# scans each paragraph once instead of per pattern
+_NYTIMES_PATTERNS = (
+    r'Subscribe to The Times.*?articles as you like\.',
+    r'Subscribe to continue reading\.',
+    r'Already a subscriber\?.*?Sign In',
+    r'Give this article.*?Read in app',
+    r'Send any friend a story.*?subscriber',
+    r'data-testid=".*?"',
+    r'class="css-.*?"',
+    r'id=".*?"',
+    r'aria-.*?=".*?"',
+    r'role=".*?"',
+    r'css-.*?',
+    r'StoryBodyCompanionColumn',
+    r'companionColumn-.*?',
+    r'Advertisement',
+    r'Continue reading the main story',
+    r'Image.*?Credit.*?',
+    r'Credit\.\.\.',
+    r'A version of this article appears in print',
+    r'Read more about:.*?$'
+)
+
+_NYTIMES_CLEAN_RE = re.compile(
+    '|'.join(f'(?:{p})' for p in _NYTIMES_PATTERNS),
+    re.IGNORECASE | re.DOTALL
+)
+
+_WS_RE = re.compile(r'\s+')
+
+# Playwright harvest: title, image, paragraphs and the paywall flag come
+# back in one evaluate instead of separate round-trips
+_NYT_HARVEST_JS = """
+() => {
+    const title = document.querySelector(
+        "h1.css-88wicj, h1[data-testid='headline'], h1.e1h9rw200, h1, .headline, [data-testid='headline']");
+    const image = Array.from(document.querySelectorAll(
+        "img.css-rq4mmj, img[src*='static01.nyt.com'], img[src*='nytimes.com'], .story-body img, article img"))
+        .map(i => i.getAttribute('src'))
+        .find(s => s && s.includes('nytimes.com')) || null;
+
+    const container = document.querySelector(
+        'section[name="articleBody"], .meteredContent, .css-1r7ky0e, .story-body, article#story');
+    let paragraphs = [];
+    if (container) {
+        let nodes = container.querySelectorAll(
+            '.StoryBodyCompanionColumn p.css-at9mc1, .StoryBodyCompanionColumn p.evys1bk0');
+        if (!nodes.length) {
+            nodes = container.querySelectorAll('p.css-at9mc1, p.evys1bk0');
+        }
+        paragraphs = Array.from(nodes).map(p => p.innerText);
+    }
+
+    const bodyText = document.body.innerText;
+    const paywall = ['Subscribe to continue reading', 'Subscribe to The Times',
+                     'Already a subscriber', 'Sign In', 'membership']
+        .some(x => bodyText.includes(x));
+
+    return {
+        title: title ? title.innerText : null,
+        image: image,
+        paragraphs: paragraphs,
+        paywall: paywall
+    };
+}
+"""
+
+# Runs inside the browser: collects every body paragraph in one JS call,
+# preferring companion columns and falling back to direct container
+# paragraphs - replaces one .text round-trip per element
+_NYT_PARAGRAPHS_JS = """
+const container = document.querySelector(arguments[0]);
+if (!container) return [];
+let paragraphs = container.querySelectorAll(
+    '.StoryBodyCompanionColumn p.css-at9mc1, .StoryBodyCompanionColumn p.evys1bk0');
+if (!paragraphs.length) {
+    paragraphs = container.querySelectorAll('p.css-at9mc1, p.evys1bk0');
+}
+return Array.from(paragraphs).map(p => p.innerText);
+"""
+
+# NYT UI/ad paragraph markers as one alternation - a single scan replaces
+# a lower() copy plus ~10 substring passes per paragraph
+_NYT_SKIP_RE = re.compile(
+    r'subscribe to the times|already a subscriber|sign in|advertisement|'
+    r'continue reading|give this article|send any friend|read in app|'
+    r'credit\.\.\.|a version of this article appears|skip advertisement',
+    re.IGNORECASE
+)
+
 def clean_nytimes_text(text):
     """Clean NYT article text - your exact approach"""
     if not text:
         return None
-    
+
     # Normalize whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
-    
-    # Remove NYT specific unwanted patterns
-    patterns_to_remove = [
-        r'Subscribe to The Times.*?articles as you like\.',
-        r'Subscribe to continue reading\.',
-        r'Already a subscriber\?.*?Sign In',
-        r'Give this article.*?Read in app',
-        r'Send any friend a story.*?subscriber',
-        r'data-testid=".*?"',
-        r'class="css-.*?"',
-        r'id=".*?"',
-        r'aria-.*?=".*?"',
-        r'role=".*?"',
-        r'css-.*?',
-        r'StoryBodyCompanionColumn',
-        r'companionColumn-.*?',
-        r'Advertisement',
-        r'Continue reading the main story',
-        r'Image.*?Credit.*?',
-        r'Credit\.\.\.',
-        r'A version of this article appears in print',
-        r'Read more about:.*?$'
-    ]
-    
-    for pattern in patterns_to_remove:
-        text = re.sub(pattern, '', text, flags=re.IGNORECASE | re.DOTALL)
-    
+    text = _WS_RE.sub(' ', text).strip()
+
+    text = _NYTIMES_CLEAN_RE.sub('', text)
+
     # Clean up extra whitespace and common artifacts
-    text = re.sub(r'\s+', ' ', text).strip()
-    text = re.sub(r'<!-- -->', '', text)
-    
+    text = _WS_RE.sub(' ', text).strip()
+    text = text.replace('<!-- -->', '')
+
     return text if len(text) > 50 else None
 
 def extract_nytimes_article_with_selenium(url, news_cookies_dir):
@@ -148,14 +275,7 @@ def extract_nytimes_article_with_selenium(url, news_cookies_dir):
     options.add_argument('--no-first-run')
     options.add_argument('--window-size=1920,1080')
     
-    # Realistic user agents for NYT (US market) - your exact list
-    user_agents = [
-        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-        'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36 Edg/119.0.0.0'
-    ]
-    
-    selected_ua = random.choice(user_agents)
+    selected_ua = random.choice(_NYT_USER_AGENTS)
     logging.info(f"🎭 Using User Agent: {selected_ua[:50]}...")
     options.add_argument(f'--user-agent={selected_ua}')
     
@@ -165,7 +285,7 @@ def extract_nytimes_article_with_selenium(url, news_cookies_dir):
     
     try:
         # Use WebDriverManager like your working Instagram code
-        service = Service(ChromeDriverManager().install())
+        service = _get_chromedriver_service()
         driver = webdriver.Chrome(service=service, options=options)
         
         # Execute stealth script - your exact approach
@@ -216,17 +336,11 @@ def extract_nytimes_article_with_selenium(url, news_cookies_dir):
             });
         """)
         
-        # Navigate to NYT first to set domain, then add cookies - your working Instagram pattern
-        logging.info("Navigating to NYT homepage to add cookies")
-        driver.get("https://www.nytimes.com")
-        time.sleep(2)
-        
-        # Load cookies using your proven Instagram method
+        # CDP cookie install doesn't need the NYT domain loaded, so no
+        # homepage warm-up or refresh - the next driver.get sends the jar
         if os.path.exists(cookie_path):
             add_cookies_from_file(driver, cookie_path)
-            driver.refresh()
-            time.sleep(2)
-            logging.info("✓ Cookies loaded and page refreshed")
+            logging.info("✓ Cookies loaded")
         else:
             logging.warning(f"Cookie file not found: {cookie_path}")
         
@@ -236,17 +350,14 @@ def extract_nytimes_article_with_selenium(url, news_cookies_dir):
         driver.get(url)
         time.sleep(5)  # Give NYT time to load
         
-        # Check for paywall
-        page_content = driver.page_source
-        paywall_indicators = [
-            'Subscribe to continue reading',
-            'Subscribe to The Times',
-            'Already a subscriber',
-            'Sign In',
-            'membership'
-        ]
-        
-        has_paywall = any(indicator in page_content for indicator in paywall_indicators)
+        # Check for paywall in-browser - avoids shipping the full
+        # page_source over the wire just to substring-scan it
+        has_paywall = driver.execute_script("""
+            const s = document.body.innerText;
+            return ['Subscribe to continue reading', 'Subscribe to The Times',
+                    'Already a subscriber', 'Sign In', 'membership']
+                .some(x => s.includes(x));
+        """)
         if has_paywall:
             logging.warning("⚠️  Paywall detected - extracting available preview content")
         
@@ -261,19 +372,18 @@ def extract_nytimes_article_with_selenium(url, news_cookies_dir):
             "[data-testid='headline']"
         ]
         
-        for selector in title_selectors:
-            try:
-                title_element = driver.find_element(By.CSS_SELECTOR, selector)
-                if title_element:
-                    title = title_element.text
-                    if title:
-                        title = title.strip()
-                        title = re.sub(r'\s+', ' ', title)
-                        title = clean_nytimes_text(title)
-                        logging.info(f"✓ Title: {title}")
-                        break
-            except:
-                continue
+        try:
+            # One joined query instead of a CDP round-trip per selector
+            title_elements = driver.find_elements(By.CSS_SELECTOR, ",".join(title_selectors))
+            if title_elements:
+                title = title_elements[0].text
+                if title:
+                    title = title.strip()
+                    title = re.sub(r'\s+', ' ', title)
+                    title = clean_nytimes_text(title)
+                    logging.info(f"✓ Title: {title}")
+        except:
+            pass
         
         # Extract first image - your exact method
         image_url = None
@@ -285,16 +395,15 @@ def extract_nytimes_article_with_selenium(url, news_cookies_dir):
             "article img"
         ]
         
-        for selector in image_selectors:
-            try:
-                img_element = driver.find_element(By.CSS_SELECTOR, selector)
-                if img_element:
-                    image_url = img_element.get_attribute('src')
-                    if image_url and 'nytimes.com' in image_url:
-                        logging.info(f"✓ Image: {image_url}")
-                        break
-            except:
-                continue
+        try:
+            for img_element in driver.find_elements(By.CSS_SELECTOR, ",".join(image_selectors)):
+                src = img_element.get_attribute('src')
+                if src and 'nytimes.com' in src:
+                    image_url = src
+                    logging.info(f"✓ Image: {image_url}")
+                    break
+        except:
+            pass
         
         # Extract article content - your exact working approach
         article_text = None
@@ -309,88 +418,33 @@ def extract_nytimes_article_with_selenium(url, news_cookies_dir):
             ]
             
             article_container = None
-            for selector in content_selectors:
-                try:
-                    container = driver.find_element(By.CSS_SELECTOR, selector)
-                    if container:
-                        article_container = container
-                        logging.info(f"✓ Found article container with selector: {selector}")
-                        break
-                except Exception as e:
-                    logging.error(f"❌ Error with selector {selector}: {e}")
-                    continue
+            containers = driver.find_elements(By.CSS_SELECTOR, ",".join(content_selectors))
+            if containers:
+                article_container = containers[0]
+                logging.info("✓ Found article container")
             
             if article_container:
-                # NYT structures content in multiple StoryBodyCompanionColumn divs - your exact approach
+                # One in-browser harvest instead of a WebDriver round-trip
+                # per companion column and per paragraph
                 try:
-                    companion_columns = article_container.find_elements(By.CSS_SELECTOR, '.StoryBodyCompanionColumn')
-                    
-                    if companion_columns:
-                        text_parts = []
-                        logging.info(f"✓ Found {len(companion_columns)} companion columns")
-                        
-                        for i, column in enumerate(companion_columns):
-                            try:
-                                # Get all paragraphs within each companion column
-                                paragraphs = column.find_elements(By.CSS_SELECTOR, "p.css-at9mc1, p.evys1bk0")
-                                
-                                for p in paragraphs:
-                                    try:
-                                        paragraph_text = p.text
-                                        if paragraph_text and len(paragraph_text.strip()) > 20:
-                                            # Skip NYT UI elements and ads
-                                            if not any(skip_word in paragraph_text.lower() for skip_word in [
-                                                'subscribe to the times', 'already a subscriber', 'sign in',
-                                                'advertisement', 'continue reading', 'give this article',
-                                                'send any friend', 'read in app', 'credit...', 
-                                                'a version of this article appears', 'skip advertisement'
-                                            ]):
-                                                clean_text = clean_nytimes_text(paragraph_text.strip())
-                                                if clean_text and len(clean_text) > 30:
-                                                    text_parts.append(clean_text)
-                                                    logging.info(f"  Added paragraph {len(text_parts)} from column {i+1}")
-                                    except:
-                                        continue
-                            except Exception as e:
-                                logging.error(f"❌ Error processing column {i+1}: {e}")
-                                continue
-                        
-                        if text_parts:
-                            article_text = ' '.join(text_parts)
-                            logging.info(f"✓ Extracted {len(text_parts)} paragraphs from companion columns ({len(article_text)} chars)")
-                        else:
-                            logging.error("❌ No valid text found in companion columns")
-                            
+                    texts = driver.execute_script(_NYT_PARAGRAPHS_JS, ",".join(content_selectors))
+                    # Generator feed into join - skips NYT UI/ads without
+                    # holding a second copy of the cleaned paragraphs
+                    article_text = ' '.join(
+                        clean_text
+                        for paragraph_text in texts
+                        if paragraph_text and len(paragraph_text.strip()) > 20
+                        and not _NYT_SKIP_RE.search(paragraph_text)
+                        if (clean_text := clean_nytimes_text(paragraph_text.strip())) and len(clean_text) > 30
+                    ) or None
+
+                    if article_text:
+                        logging.info(f"✓ Extracted article text ({len(article_text)} chars)")
                     else:
-                        logging.error("❌ No companion columns found - trying direct paragraph extraction")
-                        
-                        # Fallback: get all paragraphs directly from article container
-                        try:
-                            all_paragraphs = article_container.find_elements(By.CSS_SELECTOR, "p.css-at9mc1, p.evys1bk0")
-                            if all_paragraphs:
-                                text_parts = []
-                                for p in all_paragraphs:
-                                    try:
-                                        p_text = p.text
-                                        if p_text and len(p_text.strip()) > 30:
-                                            clean_text = clean_nytimes_text(p_text.strip())
-                                            if clean_text and len(clean_text) > 30:
-                                                text_parts.append(clean_text)
-                                    except:
-                                        continue
-                                
-                                if text_parts:
-                                    article_text = ' '.join(text_parts)
-                                    logging.info(f"✓ Fallback extracted {len(text_parts)} paragraphs ({len(article_text)} chars)")
-                                else:
-                                    logging.error("❌ Fallback found no valid content")
-                            else:
-                                logging.error("❌ No paragraphs found in fallback")
-                        except Exception as e:
-                            logging.error(f"❌ Fallback extraction error: {e}")
-                            
+                        logging.error("❌ No valid paragraphs found")
+
                 except Exception as e:
-                    logging.error(f"❌ Error finding companion columns: {e}")
+                    logging.error(f"❌ Error harvesting paragraphs: {e}")
             else:
                 logging.error("❌ Could not find article container")
                 
@@ -414,7 +468,137 @@ def extract_nytimes_article_with_selenium(url, news_cookies_dir):
         except:
             pass
 
+def _load_nytimes_cookies_pw(cookie_path):
+    """Load the NYT cookie file (JSON or Netscape) as Playwright cookie dicts"""
+    try:
+        key = ('pw', cookie_path, os.stat(cookie_path).st_mtime_ns)
+        with open(cookie_path, 'r', encoding='utf-8') as f:
+            is_json = f.read(1) == '['
+    except OSError:
+        logging.warning(f"Cookie file not found: {cookie_path}")
+        return []
+
+    cached = _COOKIE_CACHE.get(key)
+    if cached is not None:
+        return list(cached)
+
+    if not is_json:
+        cookies = parse_netscape_cookies(cookie_path)
+        _COOKIE_CACHE[key] = cookies
+        return list(cookies)
+
+    try:
+        with open(cookie_path, 'r', encoding='utf-8') as f:
+            raw_cookies = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        logging.error(f"Error parsing JSON cookies: {e}")
+        return []
+
+    cookies = []
+    for cookie in raw_cookies:
+        entry = {
+            'name': cookie.get('name'),
+            'value': cookie.get('value'),
+            'domain': cookie.get('domain'),
+            'path': cookie.get('path', '/'),
+            'secure': cookie.get('secure', False),
+            'httpOnly': cookie.get('httpOnly', False)
+        }
+        if 'expirationDate' in cookie:
+            entry['expires'] = int(cookie['expirationDate'])
+        elif 'expiry' in cookie:
+            entry['expires'] = int(cookie['expiry'])
+        cookies.append(entry)
+
+    _COOKIE_CACHE[key] = cookies
+    return list(cookies)
+
+async def extract_nytimes_article_pw(url, news_cookies_dir):
+    """Extract a NYT article with async Playwright on the shared browser pool.
+
+    Falls back to the Selenium path (in a worker thread) if the Playwright
+    attempt fails, so behaviour degrades to the proven extractor.
+    """
+    domain = get_domain_from_url(url)
+    cookie_path = os.path.join(news_cookies_dir, f"{domain}_cookies.txt")
+    cookies = _load_nytimes_cookies_pw(cookie_path)
+
+    try:
+        cookie_version = os.stat(cookie_path).st_mtime_ns
+    except OSError:
+        cookie_version = 0
+
+    try:
+        context = await browser_pool.get_context(
+            'nytimes',
+            version=cookie_version,
+            launch_args=_NYT_LAUNCH_ARGS,
+            cookies=cookies,
+            init_script=_NYT_STEALTH_JS,
+            user_agent=random.choice(_NYT_USER_AGENTS)
+        )
+
+        page = await context.new_page()
+        try:
+            logging.info(f"🌐 Loading: {url}")
+            await page.goto(url, wait_until='domcontentloaded', timeout=30000)
+            try:
+                await page.wait_for_selector(
+                    'section[name="articleBody"], .meteredContent, .css-1r7ky0e, .story-body, article#story',
+                    state='attached', timeout=10000
+                )
+            except Exception:
+                logging.warning("Article container did not appear; harvesting anyway")
+
+            harvest = await page.evaluate(_NYT_HARVEST_JS)
+        finally:
+            await page.close()
+
+        if harvest.get('paywall'):
+            logging.warning("⚠️  Paywall detected - extracting available preview content")
+
+        title = harvest.get('title')
+        if title:
+            title = clean_nytimes_text(_WS_RE.sub(' ', title.strip()))
+
+        image_url = harvest.get('image')
+
+        article_text = ' '.join(
+            clean_text
+            for paragraph_text in harvest.get('paragraphs') or []
+            if paragraph_text and len(paragraph_text.strip()) > 20
+            and not _NYT_SKIP_RE.search(paragraph_text)
+            if (clean_text := clean_nytimes_text(paragraph_text.strip())) and len(clean_text) > 30
+        ) or None
+
+        if article_text:
+            logging.info(f"✓ Extracted article text ({len(article_text)} chars)")
+            return {
+                "title": title,
+                "article": article_text,
+                "image": image_url,
+                "url": url,
+                "domain": domain
+            }
+
+        logging.error("❌ Playwright path found no valid paragraphs - falling back to Selenium")
+    except Exception as e:
+        logging.error(f"❌ Playwright extraction failed: {e} - falling back to Selenium")
+
+    return await asyncio.to_thread(extract_nytimes_article_with_selenium, url, news_cookies_dir)
+
 def extract_nytimes_article(url, news_cookies_dir):
     """Main NYT extraction function using Selenium with your exact working method"""
     result = extract_nytimes_article_with_selenium(url, news_cookies_dir)
-    return result 
\ No newline at end of file
+    return result
+
+def extract_nytimes_articles(urls, news_cookies_dir, max_workers=4):
+    """Extract several NYT articles in parallel, one Selenium driver per worker.
+
+    Selenium is blocking, so a thread pool is used instead of asyncio;
+    failed extractions come back as None (input order preserved).
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(
+            lambda url: extract_nytimes_article(url, news_cookies_dir), urls
+        )) 
\ No newline at end of file
@@ -2,20 +2,84 @@ import asyncio
 import logging
 import re
 import os
-from playwright.async_api import async_playwright
-from urllib.parse import urljoin, urlparse
+import time
+from urllib.parse import urljoin, urlparse, urlsplit, urlunsplit
+from Functions.browser_pool import browser_pool
+
+def _canonicalize(url):
+    """Normalize a URL once at entry: trim, default the scheme, lowercase the
+    host and drop any fragment, so the extraction path never re-checks it."""
+    url = url.strip()
+    parts = urlsplit(url if '://' in url else 'https://' + url)
+    return urlunsplit((parts.scheme or 'https', parts.netloc.lower(), parts.path, parts.query, ''))
+
+_LAUNCH_ARGS = (
+    "--disable-blink-features=AutomationControlled",
+    "--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+)
+
+# Ad/analytics hosts that never contribute article content
+_BLOCKLIST = ("doubleclick", "googletagmanager", "scorecardresearch", "chartbeat", "permutive")
+
+# Resource types that only matter for visual rendering
+_BLOCKED_RESOURCE_TYPES = {'image', 'media', 'font', 'stylesheet'}
+
+async def _block_heavy_resources(route, request):
+    """Abort heavy/analytics requests; imageserver stays up for the lead image"""
+    url = request.url
+    if 'thetimes.com/imageserver' in url:
+        await route.continue_()
+    elif request.resource_type in _BLOCKED_RESOURCE_TYPES or any(d in url for d in _BLOCKLIST):
+        await route.abort()
+    else:
+        await route.continue_()
+
+# Cookies that carry The Times login state; with one of these still valid
+# the main-site warm-up visit is redundant
+_AUTH_COOKIE_NAMES = {'nuid', 'authToken', 'login_session', 'token'}
+
+def _has_live_auth_cookie(cookies):
+    """True if the jar holds an unexpired auth cookie (session cookies count)."""
+    now = time.time()
+    return any(
+        cookie['name'] in _AUTH_COOKIE_NAMES and cookie.get('expires', now + 1) > now
+        for cookie in cookies
+    )
+
+# Parsed cookie lists keyed by (path, mtime_ns) — the same jar is reloaded
+# for every article, and mtime invalidates the entry on refresh
+_COOKIE_CACHE = {}
+
+def parse_netscape_cookies(file_path, domain_hint=None):
+    """Parse Netscape cookie file format - your exact approach with proper Playwright format.
+
+    With domain_hint set, lines without that substring are skipped before
+    the tab split - a cheap pre-filter for mixed-domain jars.
+    """
+    try:
+        key = (file_path, os.stat(file_path).st_mtime_ns, domain_hint)
+    except OSError:
+        logging.error(f"Cookie file {file_path} not found!")
+        return []
+
+    cached = _COOKIE_CACHE.get(key)
+    if cached is not None:
+        return list(cached)
 
-def parse_netscape_cookies(file_path):
-    """Parse Netscape cookie file format - your exact approach with proper Playwright format"""
     cookies = []
     try:
         with open(file_path, 'r') as f:
             for line in f:
-                line = line.strip()
-                if line.startswith('#') or not line:
+                if line.endswith('\n'):
+                    line = line[:-1]
+                if not line or line[0] == '#':
+                    continue
+                if domain_hint is not None and domain_hint not in line:
                     continue
-                
-                parts = line.split('\t')
+
+                # Bounded split: stop after the 7th field instead of
+                # allocating substrings for trailing data
+                parts = line.split('\t', 6)
                 if len(parts) >= 7:
                     domain = parts[0]
                     domain_flag = parts[1] == 'TRUE'
@@ -46,52 +110,95 @@ def parse_netscape_cookies(file_path):
     except FileNotFoundError:
         logging.error(f"Cookie file {file_path} not found!")
         return []
-    
-    return cookies
 
-def clean_thetimes_text(text):
-    """Clean The Times article text - adapted from your approach"""
-    if not text:
-        return None
-    
-    # Normalize whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
-    
-    # Remove The Times specific unwanted patterns
-    patterns_to_remove = [
-        r'Subscribe to The Times',
-        r'Sign up to our newsletter',
-        r'Advertisement',
-        r'Read more.*?,',
-        r'guides about what to watch',
-        r'and interviews',
-        r'Styling.*',
-        r'Hair.*at.*',
-        r'Make-up.*at.*',
-        r'Nails.*at.*',
-        r'Set designer.*',
-        r'Local production.*',
-        r'©.*',
-        r'Credit.*',
-        r'Screen reader only',
-        r'aria-hidden="true"',
-        r'data-.*?=".*?"',
-        r'class=".*?"',
-        r'id=".*?"'
-    ]
-    
-    for pattern in patterns_to_remove:
-        text = re.sub(pattern, '', text, flags=re.IGNORECASE)
-    
-    # Clean up extra whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
-    
-    return text if len(text) > 50 else None
+    _COOKIE_CACHE[key] = cookies
+    return list(cookies)
+
+# The Times specific unwanted patterns, fused into one alternation so
+# cleanup scans each paragraph once instead of per pattern; the old
+# aria-/data-/class/id branches collapse into the single attribute branch
+_THETIMES_PATTERNS = (
+    r'Subscribe to The Times',
+    r'Sign up to our newsletter',
+    r'Advertisement',
+    r'Read more.*?,',
+    r'guides about what to watch',
+    r'and interviews',
+    r'Styling.*',
+    r'Hair.*at.*',
+    r'Make-up.*at.*',
+    r'Nails.*at.*',
+    r'Set designer.*',
+    r'Local production.*',
+    r'©.*',
+    r'Credit.*',
+    r'Screen reader only',
+    r'[\w-]+="[^"]*"'
+)
+
+_THETIMES_CLEAN_RE = re.compile(
+    '|'.join(f'(?:{p})' for p in _THETIMES_PATTERNS),
+    re.IGNORECASE
+)
+
+_WS_RE = re.compile(r'\s+')
+
+# Runs inside the page so the whole selector cascade (title, container,
+# paragraphs, image) costs one CDP round-trip instead of one per element
+_THETIMES_HARVEST_JS = """
+() => {
+    const pick = (selectors) => {
+        for (const s of selectors) {
+            const el = document.querySelector(s);
+            if (el) return el;
+        }
+        return null;
+    };
+
+    const titleEl = pick([
+        "h1.responsive__HeadlineContainer-sc-3t8ix5-3",
+        "h1[class*='HeadlineContainer']",
+        "h1[role='heading']",
+        "h1"
+    ]);
+
+    const container = pick([
+        ".responsive__ArticleContent-sc-15gvuj2-8",
+        "[class*='ArticleContent']",
+        "article",
+        "main article"
+    ]);
+    let paragraphs = [];
+    if (container) {
+        for (const s of ["p.responsive__Paragraph-sc-1pktst5-0", "p[class*='Paragraph']", "p"]) {
+            const nodes = container.querySelectorAll(s);
+            if (nodes.length) {
+                paragraphs = Array.from(nodes)
+                    .map(p => p.textContent.trim())
+                    .filter(t => t.length > 20);
+                break;
+            }
+        }
+    }
+
+    // imageserver hosts every lead image; picture>img is the rare fallback.
+    // The old img[src] catch-all scanned the whole DOM just to find ad
+    // pixels, and the alt-text selector was article-specific cruft.
+    const image = (document.querySelector("img[src*='thetimes.com/imageserver']")
+        || document.querySelector("picture img[src]"))?.src || null;
+
+    return {
+        title: titleEl ? titleEl.textContent.trim() : null,
+        paragraphs: paragraphs,
+        image: image
+    };
+}
+"""
 
 def load_thetimes_cookies(cookie_file, domain, news_cookies_dir):
     """Load The Times cookies from file - your exact approach"""
     cookie_path = os.path.join(news_cookies_dir, cookie_file)
-    cookies = parse_netscape_cookies(cookie_path)
+    cookies = parse_netscape_cookies(cookie_path, domain_hint='thetimes')
     
     # Filter cookies for The Times domain
     domain_cookies = []
@@ -105,188 +212,126 @@ def load_thetimes_cookies(cookie_file, domain, news_cookies_dir):
 async def extract_thetimes_article_with_playwright(url, news_cookies_dir, cookie_file='www.thetimes.com_cookies.txt'):
     """Extract The Times article using Playwright with cookie authentication - your exact approach"""
     
-    # Ensure URL has protocol
-    if not url.startswith(('http://', 'https://')):
-        url = 'https://' + url
-        logging.info(f"Added protocol to URL: {url}")
-    
+    page = None
     try:
-        async with async_playwright() as p:
-            # Launch browser (like your Chrome options)
-            browser = await p.chromium.launch(
-                headless=True,
-                args=[
-                    "--disable-blink-features=AutomationControlled",
-                    "--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-                ]
-            )
-            context = await browser.new_context()
-            page = await context.new_page()
-            
-            # STEP 1: Go to main site first (your exact approach)
+        # STEP 1: Load cookies (your exact approach) - the shared pool
+        # batch-installs them when the context is first built, keyed by
+        # the cookie file's mtime so a refreshed jar rebuilds it
+        logging.info("Loading cookies...")
+        cookies = load_thetimes_cookies(cookie_file, 'thetimes.com', news_cookies_dir)
+
+        if cookies:
+            # Log important authentication cookies (pure Python, no awaits)
+            for cookie in cookies:
+                if any(key in cookie['name'].lower() for key in ['auth', 'session', 'subscription', 'premium', 'token', 'subscriber']):
+                    logging.info(f"✓ Adding AUTH cookie: {cookie['name']}")
+
+        try:
+            cookie_version = os.stat(os.path.join(news_cookies_dir, cookie_file)).st_mtime_ns
+        except OSError:
+            cookie_version = 0
+
+        context = await browser_pool.get_context(
+            'thetimes',
+            version=cookie_version,
+            launch_args=_LAUNCH_ARGS,
+            cookies=cookies,
+            route=('**/*', _block_heavy_resources)
+        )
+        page = await context.new_page()
+
+        # STEP 2: Warm up on the main site only when the jar has no live
+        # auth cookie - with one present the article goto works directly,
+        # saving a navigation plus a 2s settle per article
+        skipped_warmup = _has_live_auth_cookie(cookies)
+        if not skipped_warmup:
             logging.info("Loading The Times main site to establish session...")
             await page.goto("https://www.thetimes.com", wait_until='domcontentloaded', timeout=15000)
             await page.wait_for_timeout(2000)  # Like your time.sleep(2)
-            
-            # STEP 2: Load and add cookies (your exact approach)
-            logging.info("Loading cookies...")
-            cookies = load_thetimes_cookies(cookie_file, 'thetimes.com', news_cookies_dir)
-            
-            if cookies:
-                logging.info(f"Adding {len(cookies)} cookies to active session...")
-                successful_cookies = 0
-                failed_cookies = 0
-                
-                for cookie in cookies:
-                    try:
-                        await context.add_cookies([cookie])
-                        successful_cookies += 1
-                        # Log important authentication cookies
-                        if any(key in cookie['name'].lower() for key in ['auth', 'session', 'subscription', 'premium', 'token', 'subscriber']):
-                            logging.info(f"✓ Added AUTH cookie: {cookie['name']}")
-                    except Exception as e:
-                        failed_cookies += 1
-                        logging.warning(f"❌ Failed to add cookie {cookie['name']}: {e}")
-                
-                logging.info(f"Cookie Summary: {successful_cookies} successful, {failed_cookies} failed")
-            
-            # STEP 3: Navigate DIRECTLY to target article (your exact approach)
-            logging.info(f"Navigating to article: {url}")
-            await page.goto(url, wait_until='domcontentloaded', timeout=15000)
-            
-            # Scroll to trigger content loading (The Times often loads content dynamically)
-            await page.evaluate("window.scrollTo(0, document.body.scrollHeight/2)")
+
+        # STEP 3: Navigate DIRECTLY to target article (your exact approach)
+        logging.info(f"Navigating to article: {url}")
+        await page.goto(url, wait_until='domcontentloaded', timeout=15000)
+
+        if skipped_warmup and 'subscribe' in page.url:
+            # Direct navigation bounced to the paywall - fall back to the
+            # warm-up visit once and retry the article
+            logging.info("Paywall redirect detected, warming up session on main site...")
+            await page.goto("https://www.thetimes.com", wait_until='domcontentloaded', timeout=15000)
             await page.wait_for_timeout(2000)
-            
-            # Wait for page to load (like your WebDriverWait) - longer for The Times
-            await page.wait_for_selector("h1", timeout=15000)
-            await page.wait_for_timeout(5000)  # Longer wait for dynamic content
-            
-            # Wait for article content to load
-            try:
-                await page.wait_for_selector(".responsive__ArticleContent-sc-15gvuj2-8, [class*='ArticleContent']", timeout=10000)
-            except:
-                logging.warning("The Times: Article content selector not found, proceeding anyway")
-            
-            # Extract title (your exact method)
-            title = None
-            try:
-                # Try multiple The Times title selectors
-                title_selectors = [
-                    "h1.responsive__HeadlineContainer-sc-3t8ix5-3",
-                    "h1[class*='HeadlineContainer']",
-                    "h1[role='heading']",
-                    "h1"
-                ]
-                
-                for selector in title_selectors:
-                    title_element = await page.query_selector(selector)
-                    if title_element:
-                        title_text = (await title_element.text_content()).strip()
-                        # Only accept substantial titles
-                        if title_text and len(title_text) > 10:
-                            title = title_text
-                            logging.info(f"✓ Title: {title}")
-                            break
-                        else:
-                            logging.warning(f"Skipping short title: {title_text}")
-            except Exception as e:
-                logging.error(f"❌ Title extraction error: {e}")
-            
-            # Extract article body (your exact method)
-            article_text = None
-            try:
-                # Try multiple container selectors
-                container_selectors = [
-                    ".responsive__ArticleContent-sc-15gvuj2-8",
-                    "[class*='ArticleContent']",
-                    "article",
-                    "main article"
-                ]
-                
-                article_container = None
-                for selector in container_selectors:
-                    article_container = await page.query_selector(selector)
-                    if article_container:
-                        logging.info(f"✓ Found article container: {selector}")
-                        break
-                
-                if article_container:
-                    # Try multiple paragraph selectors (your approach)
-                    paragraph_selectors = [
-                        "p.responsive__Paragraph-sc-1pktst5-0",
-                        "p[class*='Paragraph']",
-                        "p"
-                    ]
-                    
-                    paragraph_elements = []
-                    for selector in paragraph_selectors:
-                        paragraph_elements = await article_container.query_selector_all(selector)
-                        if paragraph_elements:
-                            logging.info(f"✓ Found {len(paragraph_elements)} paragraphs with: {selector}")
-                            break
-                    
-                    if paragraph_elements:
-                        text_parts = []
-                        for p in paragraph_elements:
-                            paragraph_text = (await p.text_content()).strip()
-                            if paragraph_text and len(paragraph_text) > 20:
-                                clean_paragraph = clean_thetimes_text(paragraph_text)
-                                if clean_paragraph:
-                                    text_parts.append(clean_paragraph)
-                        
-                        if text_parts:
-                            article_text = ' '.join(text_parts)
-                            logging.info(f"✓ Extracted {len(text_parts)} paragraphs ({len(article_text)} chars)")
-                        else:
-                            logging.error("❌ No valid paragraphs found after cleaning")
-                    else:
-                        logging.error("❌ No paragraph elements found with any selector")
-                else:
-                    logging.error("❌ Article container not found with any selector")
-                    
-            except Exception as e:
-                logging.error(f"❌ Article extraction error: {e}")
-            
-            # Extract first image (your exact method)
-            image_url = None
-            try:
-                # Look for images in The Times imageserver
-                img_selectors = [
-                    "img[src*='thetimes.com/imageserver']",
-                    "picture img[src]",
-                    "img[alt*='Uma Thurman']",
-                    "img[src]"
-                ]
-                
-                for selector in img_selectors:
-                    img_element = await page.query_selector(selector)
-                    if img_element:
-                        image_url = await img_element.get_attribute('src')
-                        if image_url and 'thetimes.com' in image_url:
-                            logging.info(f"✓ Image: {image_url}")
-                            break
-            except Exception as e:
-                logging.error(f"❌ Image extraction error: {e}")
-            
-            await browser.close()
-            
-            if article_text and len(article_text) > 100:
-                return {
-                    "title": title,
-                    "article": article_text,
-                    "image": image_url,
-                    "url": url
-                }
+            await page.goto(url, wait_until='domcontentloaded', timeout=15000)
+
+        # Scroll to trigger content loading (The Times often loads content dynamically)
+        await page.evaluate("window.scrollTo(0, document.body.scrollHeight/2)")
+        await page.wait_for_timeout(2000)
+        
+        # Wait for page to load (like your WebDriverWait) - longer for The Times
+        await page.wait_for_selector("h1", timeout=15000)
+        await page.wait_for_timeout(2000)  # Ads no longer arrive, shorter settle is enough
+        
+        # Wait for article content to load
+        try:
+            await page.wait_for_selector(".responsive__ArticleContent-sc-15gvuj2-8, [class*='ArticleContent']", timeout=10000)
+        except:
+            logging.warning("The Times: Article content selector not found, proceeding anyway")
+        
+        # One evaluate harvests title, paragraphs and image together
+        # instead of a CDP round-trip per selector and per element
+        title = None
+        article_text = None
+        image_url = None
+        try:
+            harvest = await page.evaluate(_THETIMES_HARVEST_JS)
+
+            title_text = harvest.get('title')
+            # Only accept substantial titles
+            if title_text and len(title_text) > 10:
+                title = title_text
+                logging.info(f"✓ Title: {title}")
+            elif title_text:
+                logging.warning(f"Skipping short title: {title_text}")
+
+            # Tight comprehensions over the harvested batch - one pass to
+            # clean, one to drop the leftovers that shrank below useful
+            text_parts = [
+                _WS_RE.sub(' ', _THETIMES_CLEAN_RE.sub('', paragraph)).strip()
+                for paragraph in harvest.get('paragraphs') or []
+            ]
+            text_parts = [part for part in text_parts if len(part) > 50]
+
+            if text_parts:
+                article_text = ' '.join(text_parts)
+                logging.info(f"✓ Extracted {len(text_parts)} paragraphs ({len(article_text)} chars)")
             else:
-                logging.error(f"The Times: Article text too short or empty - possible paywall issue")
-                return None
-                
+                logging.error("❌ No valid paragraphs found after cleaning")
+
+            image_url = harvest.get('image')
+            if image_url:
+                logging.info(f"✓ Image: {image_url}")
+
+        except Exception as e:
+            logging.error(f"❌ Article extraction error: {e}")
+
+        if article_text and len(article_text) > 100:
+            return {
+                "title": title,
+                "article": article_text,
+                "image": image_url,
+                "url": url
+            }
+        else:
+            logging.error(f"The Times: Article text too short or empty - possible paywall issue")
+            return None
+
     except Exception as e:
         logging.error(f"The Times Playwright extraction failed: {e}")
         return None
+    finally:
+        # Page is per-article; the pooled context and browser stay warm
+        if page is not None:
+            await page.close()
 
 async def extract_thetimes_article(url, news_cookies_dir):
     """Main The Times extraction function"""
-    result = await extract_thetimes_article_with_playwright(url, news_cookies_dir)
+    result = await extract_thetimes_article_with_playwright(_canonicalize(url), news_cookies_dir)
     return result 
\ No newline at end of file
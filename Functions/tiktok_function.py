@@ -5,34 +5,30 @@ import Functions.PyHack as pyk
 import logging
 import time
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("./logs/tiktok_downloader.log"),
-        logging.StreamHandler()
-    ]
-)
+# Queue-based handlers keep log writes off the download path
+import Functions.logging_setup  # noqa: F401
+
+# Deletion table for invalid filename characters - str.translate runs the
+# whole scan in C, no regex machinery needed for a plain character class
+_SANITIZE_TABLE = str.maketrans('', '', '<>:"/\\|?*=&')
 
 def sanitize_filename(filename: str) -> str:
     """Sanitize the filename to remove invalid characters."""
-    filename = re.sub(r'[<>:"/\\|?*=&]', '', filename)  # Remove invalid characters
-    filename = filename.strip()  # Remove leading/trailing whitespace
-    return filename
+    return filename.translate(_SANITIZE_TABLE).strip()
 
 def get_tiktok_caption(metadata_path):
     """Extract the video description from the metadata CSV file."""
     try:
-        with open(metadata_path, 'r', encoding='utf-8') as file:
-            reader = csv.reader(file)
-            next(reader)  # Skip header
-            first_data_row = next(reader, None)
-            if first_data_row and len(first_data_row) > 8:
-                # Video description is typically in column 8 (index 8)
-                return first_data_row[8]
+        # newline='' per the csv docs; only the first data row is lexed
+        with open(metadata_path, newline='', encoding='utf-8') as file:
+            rows = csv.reader(file)
+            next(rows, None)  # Skip header
+            first_data_row = next(rows, None)
+        if first_data_row and len(first_data_row) > 8:
+            # Video description is typically in column 8 (index 8)
+            return first_data_row[8]
         return None
-    except Exception as e:
+    except (OSError, csv.Error) as e:
         logging.error(f"Error reading caption: {e}")
         return None
 
@@ -61,32 +57,31 @@ def download_tiktok_video(video_url, output_dir):
         
         # Generate expected filename based on video URL
         video_id = video_url.split('/')[-1].split('?')[0]  # Remove query parameters
-        video_filename = f"tiktok_video_{video_id}.mp4"
-        video_filename = sanitize_filename(video_filename)  # Sanitize filename
-        
-        # Check if the file exists at expected path
-        video_path = os.path.join(output_dir, video_filename)
-        if os.path.exists(video_path):
+        video_filename = sanitize_filename(f"tiktok_video_{video_id}.mp4")
+
+        # One directory scan answers every "does it exist" probe and carries
+        # the mtimes for the last-resort pick, instead of a stat per guess
+        with os.scandir(output_dir) as it:
+            entries = {e.name: e for e in it if e.name.endswith('.mp4')}
+
+        # Fallback name: the path component of the original URL
+        regex_url = re.findall(r'(?<=\.com/)(.+?)(?=\?|$)', video_url)
+        alt_filename = regex_url[0].replace('/', '_') + '.mp4' if regex_url else None
+
+        if video_filename in entries:
+            video_path = os.path.join(output_dir, video_filename)
             logging.info(f"Downloaded video found at expected path: {video_path}")
+        elif alt_filename and alt_filename in entries:
+            video_path = os.path.join(output_dir, alt_filename)
+            logging.info(f"Downloaded video found using regex URL: {video_path}")
+        elif entries:
+            # Last resort: the most recent mp4, using the stats cached by scandir
+            newest = max(entries.values(), key=lambda e: e.stat().st_mtime)
+            video_path = newest.path
+            logging.info(f"Downloaded video found using most recent file: {video_path}")
         else:
-            # Fallback: Extract video URL using regex from original URL
-            regex_url = re.findall(r'(?<=\.com/)(.+?)(?=\?|$)', video_url)
-            if regex_url:
-                alt_filename = regex_url[0].replace('/', '_') + '.mp4'
-                alt_path = os.path.join(output_dir, alt_filename)
-                if os.path.exists(alt_path):
-                    video_path = alt_path
-                    logging.info(f"Downloaded video found using regex URL: {video_path}")
-                else:
-                    # Last resort: Find the most recent mp4 file
-                    mp4_files = [f for f in os.listdir(output_dir) if f.endswith('.mp4')]
-                    if mp4_files:
-                        mp4_files.sort(key=lambda f: os.path.getmtime(os.path.join(output_dir, f)), reverse=True)
-                        video_path = os.path.join(output_dir, mp4_files[0])
-                        logging.info(f"Downloaded video found using most recent file: {video_path}")
-                    else:
-                        logging.error("No mp4 files found in output directory")
-                        raise FileNotFoundError("No .mp4 files found after download")
+            logging.error("No mp4 files found in output directory")
+            raise FileNotFoundError("No .mp4 files found after download")
         
         # Extract caption from metadata
         caption = get_tiktok_caption(metadata_filename)
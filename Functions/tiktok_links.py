@@ -4,12 +4,79 @@ Uses the latest TikTok captcha solver API with Chrome 137 support.
 """
 
 import logging
+import os
 import time
 from typing import List
-from selenium.webdriver.common.by import By
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
 import config
 
 
+def _wait_for_page_ready(driver, timeout=10):
+    """Block until the document finishes loading instead of a fixed sleep."""
+    WebDriverWait(driver, timeout).until(
+        lambda d: d.execute_script("return document.readyState") == "complete"
+    )
+
+# Parsed cookie lists keyed by (path, mtime_ns) — accounts are scraped in
+# batches against the same jar, and mtime invalidates the entry on refresh
+_COOKIE_CACHE = {}
+
+
+def _load_tiktok_cookies(cookie_path: str) -> List[dict]:
+    """Parse the Netscape cookie file into Selenium cookie dicts (TikTok only)."""
+    key = (cookie_path, os.stat(cookie_path).st_mtime_ns)
+    cached = _COOKIE_CACHE.get(key)
+    if cached is not None:
+        return list(cached)
+
+    cookies = []
+    now = int(time.time())  # One clock read for the whole jar
+    with open(cookie_path, 'r') as file:
+        for line in file:
+            if line.endswith('\n'):
+                line = line[:-1]
+            if not line or line[0] == '#':
+                continue
+            # Cheap substring pre-filter: most jars are mixed-domain, so
+            # skip foreign lines before paying for the split
+            if 'tiktok.com' not in line:
+                continue
+            # Bounded split: stop after the 7th field
+            fields = line.split('\t', 6)
+            if len(fields) >= 7:
+                # Only load TikTok cookies (the pre-filter can match values)
+                if 'tiktok.com' not in fields[0]:
+                    continue
+
+                cookie_dict = {
+                    'name': fields[5],
+                    'value': fields[6],
+                    'domain': fields[0],
+                    'path': fields[2]
+                }
+
+                # Handle secure flag
+                if fields[3].lower() == 'true':
+                    cookie_dict['secure'] = True
+
+                # Handle expiry - skip cookies with invalid expiry values
+                if fields[4] != '0' and fields[4].isdigit():
+                    try:
+                        expiry_value = int(fields[4])
+                        # Only set expiry if it's a reasonable future timestamp
+                        if expiry_value > now:
+                            cookie_dict['expiry'] = expiry_value
+                    except (ValueError, OverflowError):
+                        # Skip cookies with invalid expiry values
+                        continue
+
+                cookies.append(cookie_dict)
+
+    _COOKIE_CACHE[key] = cookies
+    return list(cookies)
+
+
 def tiktok_scraper(driver, account_url: str, cookie_path: str, api_key: str, max_videos: int) -> List[str]:
     """
     Scrape TikTok account for video links with integrated captcha solving.
@@ -28,44 +95,55 @@ def tiktok_scraper(driver, account_url: str, cookie_path: str, api_key: str, max
     processed_urls = set()
     MAX_ATTEMPTS = config.TIKTOK_MAX_ATTEMPTS
     RETRY_WAIT = config.TIKTOK_RETRY_WAIT
-    
-    CONTAINER_XPATHS = config.TIKTOK_CONTAINER_XPATHS
-    
+
     def extract_posts():
-        """Extract posts from the current page using multiple XPath patterns."""
-        recent_posts = []
-        for xpath in CONTAINER_XPATHS:
-            try:
-                container = driver.find_element(By.XPATH, xpath)
-                posts = container.find_elements(By.XPATH, './/div[@data-e2e="user-post-item"]//a')
-                if posts:
-                    links = [p.get_attribute('href') for p in posts]
-                    filtered_links = [link for link in links if link not in processed_urls]
-                    recent_posts.extend(filtered_links)
-                    for link in filtered_links:
-                        processed_urls.add(link)
-                    if filtered_links:
-                        logging.info(f"Found {len(filtered_links)} new posts using xpath: {xpath}")
-                    return list(dict.fromkeys(recent_posts))  # Remove duplicates
-            except Exception as e:
-                logging.error(f"XPath {xpath} failed: {str(e)}")
-                continue
-        return []
+        """Extract post links from the current page in one in-browser call."""
+        try:
+            # The data-e2e attribute is unique to post items, so one
+            # querySelectorAll replaces the container XPath walk and the
+            # per-anchor get_attribute round-trips
+            hrefs = driver.execute_script(
+                "return Array.from(document.querySelectorAll("
+                "'div[data-e2e=\"user-post-item\"] a')).map(a => a.href)"
+            )
+        except Exception as e:
+            logging.error(f"Post extraction failed: {str(e)}")
+            return []
+
+        # The running set dedupes both across and within batches, so no
+        # extra dict.fromkeys pass is needed
+        filtered_links = []
+        for link in hrefs:
+            if link and link not in processed_urls:
+                processed_urls.add(link)
+                filtered_links.append(link)
+        if filtered_links:
+            logging.info(f"Found {len(filtered_links)} new posts")
+        return filtered_links
     
+    def height_changed(previous_height):
+        """Predicate: the document grew past previous_height."""
+        return lambda d: d.execute_script("return document.documentElement.scrollHeight") != previous_height
+
     def scroll_and_extract():
         """Scroll the page and extract new posts until no more content loads."""
         last_height = driver.execute_script("return document.documentElement.scrollHeight")
         while len(video_links) < max_videos:
-            # Scroll down
+            # Scroll down and wait for actual content instead of a fixed 2s
             driver.execute_script("window.scrollTo(0, document.documentElement.scrollHeight);")
-            time.sleep(2)  # Wait for content to load
-            
+            try:
+                WebDriverWait(driver, 4, poll_frequency=0.25).until(height_changed(last_height))
+            except TimeoutException:
+                pass  # The height check below decides whether we're done
+
             # Get new posts
             new_links = extract_posts()
             if new_links:
                 video_links.extend(new_links)
                 logging.info(f"Total videos found: {len(video_links)}")
-            
+                if len(video_links) >= max_videos:
+                    break  # Enough collected - skip further scrolls
+
             # Check if we've reached the bottom
             new_height = driver.execute_script("return document.documentElement.scrollHeight")
             if new_height == last_height:
@@ -82,48 +160,17 @@ def tiktok_scraper(driver, account_url: str, cookie_path: str, api_key: str, max
         
         # Load cookies (using same approach as Instagram/X)
         logging.info("Loading cookies...")
-        with open(cookie_path, 'r') as file:
-            for line in file:
-                if line.startswith('#') or not line.strip():
-                    continue
-                fields = line.strip().split('\t')
-                if len(fields) >= 7:
-                    # Only load TikTok cookies
-                    if 'tiktok.com' not in fields[0]:
-                        continue
-                    
-                    cookie_dict = {
-                        'name': fields[5],
-                        'value': fields[6],
-                        'domain': fields[0],
-                        'path': fields[2]
-                    }
-                    
-                    # Handle secure flag
-                    if fields[3].lower() == 'true':
-                        cookie_dict['secure'] = True
-                    
-                    # Handle expiry - skip cookies with invalid expiry values
-                    if fields[4] != '0' and fields[4].isdigit():
-                        try:
-                            expiry_value = int(fields[4])
-                            # Only set expiry if it's a reasonable future timestamp
-                            if expiry_value > int(time.time()):
-                                cookie_dict['expiry'] = expiry_value
-                        except (ValueError, OverflowError):
-                            # Skip cookies with invalid expiry values
-                            continue
-                    
-                    try:
-                        driver.delete_cookie(fields[5])  # Delete first like X does
-                        driver.add_cookie(cookie_dict)
-                    except Exception as e:
-                        # Only log warning for cookie issues instead of error
-                        logging.warning(f"Skipped cookie {fields[5]}: {str(e)[:50]}...")
+        for cookie_dict in _load_tiktok_cookies(cookie_path):
+            try:
+                driver.delete_cookie(cookie_dict['name'])  # Delete first like X does
+                driver.add_cookie(cookie_dict)
+            except Exception as e:
+                # Only log warning for cookie issues instead of error
+                logging.warning(f"Skipped cookie {cookie_dict['name']}: {str(e)[:50]}...")
         
         driver.refresh()
-        time.sleep(5)
-        
+        _wait_for_page_ready(driver)
+
         # Process account
         attempts = 0
         logging.info(f"Processing TikTok account: {account_url}")
@@ -131,11 +178,11 @@ def tiktok_scraper(driver, account_url: str, cookie_path: str, api_key: str, max
         while attempts < MAX_ATTEMPTS:
             attempts += 1
             driver.get(account_url)
-            time.sleep(5)
-            
+            _wait_for_page_ready(driver)
+
             # Handle captcha if present - captcha solver is now automatic via the driver
             logging.info("Captcha solver is integrated into driver - will handle automatically")
-            time.sleep(2)
+            time.sleep(0.5)  # Short tail just for captcha rendering
             
             # Try to scroll and get all videos
             scroll_and_extract()
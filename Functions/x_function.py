@@ -1,20 +1,51 @@
+import atexit
 import os
 import hashlib
 import logging
+import threading
+from functools import lru_cache
 import yt_dlp
 
 # Define the path to the Netscape cookie file
 COOKIE_FILE_PATH = "./cookies/x.txt"
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("./logs/video_downloader.log"),
-        logging.StreamHandler()
-    ]
-)
+# Options shared by every download; outtmpl is set per call
+_BASE_OPTS = {
+    'format': 'bestvideo[ext=mp4][vcodec^=avc1]+bestaudio[ext=m4a]/best[ext=mp4][vcodec^=avc1]',
+    'merge_output_format': 'mp4',
+    'noplaylist': True,
+    'cookiefile': COOKIE_FILE_PATH,
+    # Metadata is read from extract_info's return value, so no
+    # sidecar JSON write or verbose log formatting is needed
+    'writeinfojson': False,
+    'quiet': True,
+    'verbose': False,
+    'no_warnings': True,
+    'noprogress': True,
+    'concurrent_fragment_downloads': 4
+}
+
+# One YoutubeDL reused across downloads - constructing it reloads every
+# extractor and recompiles their regexes, which dwarfs a short clip's
+# download time. yt-dlp isn't thread-safe, hence the lock.
+_YDL = None
+_YDL_LOCK = threading.Lock()
+
+def _get_ydl():
+    global _YDL
+    if _YDL is None:
+        _YDL = yt_dlp.YoutubeDL(dict(_BASE_OPTS))
+        atexit.register(_YDL.close)
+    return _YDL
+
+# Queue-based handlers keep log writes off the download path
+import Functions.logging_setup  # noqa: F401
+
+@lru_cache(maxsize=256)
+def _hashed_video_name(video_url):
+    """Filename hash for a video URL - blake2b is faster than md5 and safe
+    on FIPS builds; cached so retry paths don't rehash the same URL."""
+    return hashlib.blake2b(video_url.encode('utf-8'), digest_size=16).hexdigest() + ".mp4"
 
 def download_x_video(video_url, output_dir):
     """
@@ -23,22 +54,13 @@ def download_x_video(video_url, output_dir):
     """
     try:
         # Generate unique output filename
-        hashed_name = hashlib.md5(video_url.encode()).hexdigest() + ".mp4"
+        hashed_name = _hashed_video_name(video_url)
         output_file = os.path.join(output_dir, hashed_name)
 
-        ydl_opts = {
-            'outtmpl': output_file,
-            'format': 'bestvideo[ext=mp4][vcodec^=avc1]+bestaudio[ext=m4a]/best[ext=mp4][vcodec^=avc1]',
-            'merge_output_format': 'mp4',
-            'noplaylist': True,
-            'cookiefile': COOKIE_FILE_PATH,
-            'writeinfojson': True,
-            'quiet': False,
-            'verbose': True
-        }
-
         logging.info(f"Starting yt-dlp download: {video_url}")
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        with _YDL_LOCK:
+            ydl = _get_ydl()
+            ydl.params['outtmpl'] = {'default': output_file}
             info = ydl.extract_info(video_url, download=True)
 
         # Extract metadata
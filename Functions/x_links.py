@@ -2,15 +2,74 @@
 X/Twitter Links Scraper Module
 
 This module contains functions for scraping video links from X/Twitter profiles.
-Uses BeautifulSoup for HTML parsing and handles cookie authentication.
+Parses HTML with selectolax's Lexbor engine (BeautifulSoup fallback) and
+handles cookie authentication.
 """
 
 import logging
 import time
 import undetected_chromedriver as uc
-from bs4 import BeautifulSoup
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.common.by import By
 import config
 
+# Lexbor parses an order of magnitude faster than BeautifulSoup+lxml and
+# runs the translateY filter in C via a CSS selector; BS4 stays as the
+# fallback when selectolax isn't installed
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+    from bs4 import BeautifulSoup
+
+
+# The virtualized timeline lives in one container; parsing just its
+# innerHTML keeps parse work bounded to the ~10-20 tweets near the
+# viewport instead of the whole accumulated document
+_TIMELINE_SELECTOR = 'div[aria-label^="Timeline"], div[data-testid="primaryColumn"]'
+
+
+def _find_timeline_container(driver):
+    """Locate the timeline container element, or None on non-standard layouts."""
+    try:
+        return driver.find_element(By.CSS_SELECTOR, _TIMELINE_SELECTOR)
+    except Exception:
+        return None
+
+
+def _parse_video_posts(html_source):
+    """Yield (href, datetime) for each translateY-positioned post with a video player."""
+    if LexborHTMLParser is not None:
+        tree = LexborHTMLParser(html_source)
+        for node in tree.css('div[style*="translateY"]'):
+            if node.css_first('div[data-testid="videoPlayer"]') is None:
+                continue
+            post_div = node.css_first('div.css-175oi2r.r-18u37iz.r-1q142lx')
+            if post_div is None:
+                continue
+            post_link = post_div.css_first('a[href]')
+            time_element = post_div.css_first('time')
+            yield (
+                post_link.attributes.get('href') if post_link is not None else None,
+                time_element.attributes.get('datetime') if time_element is not None else None
+            )
+    else:
+        soup = BeautifulSoup(html_source, 'lxml')
+        for video_div in soup.find_all('div', style=True):
+            if 'translateY' not in video_div.get('style', ''):
+                continue
+            if not video_div.find('div', {'data-testid': 'videoPlayer'}):
+                continue
+            post_div = video_div.find('div', class_='css-175oi2r r-18u37iz r-1q142lx')
+            if not post_div:
+                continue
+            post_link = post_div.find('a', href=True)
+            time_element = post_div.find('time')
+            yield (
+                post_link['href'] if post_link else None,
+                time_element['datetime'] if time_element else None
+            )
+
 
 def load_cookies(driver, cookie_path):
     """
@@ -141,39 +200,41 @@ def x_scraper(driver, account_url: str, cookie_path: str, cutoff_date: str, chro
         logging.info(f"Processing X account: {account_url}")
         driver.get(account_url)
         time.sleep(5)
-        
+
+        # Cache the container once; each scroll serializes only its subtree
+        timeline = _find_timeline_container(driver)
+
         while True:  # Continue scrolling until break conditions are met
             videos_before = len(seen_urls)
-            
-            html_source = driver.page_source
-            soup = BeautifulSoup(html_source, 'lxml')
-            video_divs = soup.find_all('div', style=True)
+
+            html_source = None
+            if timeline is not None:
+                try:
+                    html_source = driver.execute_script("return arguments[0].innerHTML", timeline)
+                except StaleElementReferenceException:
+                    # Navigation or a re-render replaced the node - re-find it
+                    timeline = _find_timeline_container(driver)
+                    if timeline is not None:
+                        html_source = driver.execute_script("return arguments[0].innerHTML", timeline)
+            if html_source is None:
+                # Fallback: the full document, as before
+                html_source = driver.page_source
             earliest_date_found = None
-            
-            for video_div in video_divs:
-                style = video_div.get('style', '')
-                if 'translateY' in style:
-                    video_component = video_div.find('div', {'data-testid': 'videoPlayer'})
-                    if not video_component:
-                        continue
-                    
-                    post_div = video_div.find('div', class_='css-175oi2r r-18u37iz r-1q142lx')
-                    if post_div:
-                        post_link = post_div.find('a', href=True)
-                        time_element = post_div.find('time')
-                        post_date = time_element['datetime'][:10] if time_element else None
-                        
-                        if post_date:
-                            last_processed_date = post_date
-                            if earliest_date_found is None or post_date < earliest_date_found:
-                                earliest_date_found = post_date
-                                
-                            if post_date >= cutoff_date:
-                                post_url = f"https://twitter.com{post_link['href']}"
-                                if post_url not in seen_urls:
-                                    seen_urls.add(post_url)
-                                    video_links.append(post_url)
-                                    logging.info(f"Found video: {post_url} from {post_date}")
+
+            for post_href, post_datetime in _parse_video_posts(html_source):
+                post_date = post_datetime[:10] if post_datetime else None
+
+                if post_date:
+                    last_processed_date = post_date
+                    if earliest_date_found is None or post_date < earliest_date_found:
+                        earliest_date_found = post_date
+
+                    if post_date >= cutoff_date and post_href:
+                        post_url = f"https://twitter.com{post_href}"
+                        if post_url not in seen_urls:
+                            seen_urls.add(post_url)
+                            video_links.append(post_url)
+                            logging.info(f"Found video: {post_url} from {post_date}")
             
             videos_after = len(seen_urls)
             
@@ -94,7 +94,7 @@ from Functions.thetimes_news import extract_thetimes_article
 from Functions.jeuneafrique_news import extract_jeuneafrique_article
 from Functions.liberation_news import extract_liberation_article
 from Functions.leparisien_news import extract_leparisien_article
-from Functions.nytimes_news import extract_nytimes_article
+from Functions.nytimes_news import extract_nytimes_article_pw
 
 # Transcription imports
 import tempfile
@@ -1454,9 +1454,9 @@ async def extract_article_with_playwright(url):
     
     # Route to appropriate news module
     if site_type == 'lemonde':
-        return await extract_lemonde_article(url, NEWS_COOKIES_DIR)
+        return (await extract_lemonde_article(url, NEWS_COOKIES_DIR)).as_dict()
     elif site_type == 'figaro':
-        return await extract_figaro_article(url, NEWS_COOKIES_DIR)
+        return (await extract_figaro_article(url, NEWS_COOKIES_DIR)).as_dict()
     elif site_type == 'lepoint':
         return await extract_lepoint_article(url, NEWS_COOKIES_DIR)
     elif site_type == 'letemps':
@@ -1476,7 +1476,7 @@ async def extract_article_with_playwright(url):
     elif site_type == 'leparisien':
         return await extract_leparisien_article(url, NEWS_COOKIES_DIR)
     elif site_type == 'nytimes':
-        return extract_nytimes_article(url, NEWS_COOKIES_DIR)  # Selenium is synchronous, no await needed
+        return await extract_nytimes_article_pw(url, NEWS_COOKIES_DIR)
     else:
         raise ValueError(f"No handler for news site type: {site_type}")
 